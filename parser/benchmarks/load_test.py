@@ -0,0 +1,114 @@
+"""
+Load test for lookup server. Sends exact lookups of random headwords over
+keep-alive connections & reports throughput with client side latencies.
+
+Start server first, then run inside the parser folder:
+python3 -m benchmarks.load_test --requests 20000 --connections 2
+"""
+
+import argparse
+import asyncio
+import json
+import random
+from time import perf_counter, perf_counter_ns
+from urllib.parse import urlencode
+
+from src.parser import instrumentation
+
+
+async def _request(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, target: str
+) -> bytes:
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    head = await reader.readuntil(b"\r\n\r\n")
+    content_length = 0
+
+    for line in head.decode("latin-1").split("\r\n"):
+        name, _, value = line.partition(":")
+
+        if name.lower() == "content-length":
+            content_length = int(value)
+
+    return await reader.readexactly(content_length)
+
+
+async def _run_connection(
+    host: str, port: int, targets: list[str], latencies: list[int]
+) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+
+    for target in targets:
+        start = perf_counter_ns()
+        await _request(reader, writer, target)
+        latencies.append(perf_counter_ns() - start)
+
+    writer.close()
+
+
+async def _run(args: argparse.Namespace, headwords: list[str]) -> None:
+    # Requests are shared evenly between connections.
+    connection_targets: list[list[str]] = [[] for _ in range(args.connections)]
+
+    for i in range(args.requests):
+        headword = random.choice(headwords)
+        connection_targets[i % args.connections].append(
+            f"/lookup?{urlencode({'headword': headword})}"
+        )
+
+    latencies: list[int] = []
+
+    start = perf_counter()
+    await asyncio.gather(
+        *(
+            _run_connection(args.host, args.port, targets, latencies)
+            for targets in connection_targets
+        )
+    )
+    seconds = perf_counter() - start
+
+    percentiles = instrumentation.get_latency_percentiles(latencies)
+    print(
+        f"{len(latencies)} requests in {seconds:.2f} s: {len(latencies) / seconds:.0f} req/s"
+    )
+    print(
+        f"Client latency p50 {percentiles['p50_us']:.0f} µs, "
+        f"p90 {percentiles['p90_us']:.0f} µs, p99 {percentiles['p99_us']:.0f} µs"
+    )
+
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    metrics = json.loads(await _request(reader, writer, "/metrics"))
+    writer.close()
+
+    lookups = metrics["routes"]["/lookup"]
+    print(
+        f"Server latency p50 {lookups['p50_us']:.0f} µs, "
+        f"p90 {lookups['p90_us']:.0f} µs, p99 {lookups['p99_us']:.0f} µs"
+    )
+    print(f"Server lookup cache: {metrics['cache']['lookup']}")
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Load test lookup server.")
+    arg_parser.add_argument("--host", default="127.0.0.1")
+    arg_parser.add_argument("--port", type=int, default=8000)
+    arg_parser.add_argument(
+        "--file",
+        default="dictionary.json",
+        help="Dictionary JSON to pick headwords from.",
+    )
+    arg_parser.add_argument("--requests", type=int, default=20_000)
+    arg_parser.add_argument("--connections", type=int, default=2)
+    arg_parser.add_argument(
+        "--seed", type=int, default=0, help="Seed for picking headwords."
+    )
+    args = arg_parser.parse_args()
+
+    with open(args.file, "r") as json_file:
+        headwords = [entry["headword"] for entry in json.load(json_file)]
+
+    random.seed(args.seed)
+    asyncio.run(_run(args, headwords))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Memory held by parsed entries, and cost of serialising them repeatedly.
+
+Run inside the parser folder:
+
+    python3 -m benchmarks.memory                      # Fixture pages in tests/test_data
+    python3 -m benchmarks.memory --corpus resources/text
+"""
+
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.stages import copy_fixtures_to_corpus, test_data_folder
+from src.parser import reader, writer
+from src.parser.dictionary import Dictionary, DictionaryPage
+
+
+def _get_serialising_seconds(dictionary: Dictionary, rounds: int) -> list[float]:
+    entries = dictionary.get_entries()
+    seconds: list[float] = []
+
+    for _ in range(rounds):
+        start = time.perf_counter()
+        writer.write_entries_to_json(entries, io.StringIO())
+        seconds.append(time.perf_counter() - start)
+
+    return seconds
+
+
+def run_benchmark(corpus: str, rounds: int) -> dict[str, float]:
+    dictionary_pages = [
+        DictionaryPage(name=name, lines=lines)
+        for name, lines in reader.read_files(corpus)
+    ]
+
+    # Only entries themselves are traced, not pages they were parsed from.
+    tracemalloc.start()
+    entries = Dictionary(dictionary_pages).get_entries()
+    parsed_bytes, peak_bytes = tracemalloc.get_traced_memory()
+
+    # Entries keep what serialising them once computes.
+    writer.write_entries_to_json(entries, io.StringIO())
+    serialised_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    seconds = _get_serialising_seconds(Dictionary(dictionary_pages), rounds)
+
+    return {
+        "entries": len(entries),
+        "parsed_bytes": parsed_bytes,
+        "serialised_bytes": serialised_bytes,
+        "peak_bytes": peak_bytes,
+        "bytes_per_entry": serialised_bytes / len(entries) if entries else 0.0,
+        "first_serialise_seconds": seconds[0],
+        "repeated_serialise_seconds": min(seconds[1:], default=seconds[0]),
+    }
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Benchmark memory of entries.")
+    arg_parser.add_argument(
+        "--corpus",
+        help="Folder of page text files. Defaults to fixture pages of tests.",
+    )
+    arg_parser.add_argument("--rounds", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    # Parser reports oddities of pages to stdout, keep them out of results.
+    with contextlib.redirect_stdout(io.StringIO()):
+        if args.corpus:
+            result = run_benchmark(args.corpus, args.rounds)
+        else:
+            with tempfile.TemporaryDirectory() as folder:
+                copy_fixtures_to_corpus(folder)
+                result = run_benchmark(folder, args.rounds)
+
+    print(f"corpus: {args.corpus or test_data_folder}")
+
+    for name, value in result.items():
+        print(
+            f"{name:<30} {value:>14,.3f}"
+            if isinstance(value, float)
+            else f"{name:<30} {value:>14,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
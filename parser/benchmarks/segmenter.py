@@ -0,0 +1,59 @@
+"""
+Micro-benchmark for per-page cost of entry segmentation.
+
+Run inside the parser folder: python3 -m benchmarks.segmenter
+"""
+
+import os
+import timeit
+from typing import Final
+
+from benchmarks.stages import FIXTURE_PAGES, test_data_folder
+from src.parser import columns, segmenter
+from src.parser.page import Page
+
+# Fixture pages of a single column of entries.
+_fixture_files: Final[list[str]] = [
+    "simple-page.txt",
+    "simple-page-linebreaks.txt",
+    "simple-page-irregular-meta-line.txt",
+    "split-y-continuation.txt",
+]
+
+
+def _read_page_content(file: str, name: str) -> tuple[str, str]:
+    with open(os.path.join(test_data_folder, file), "r") as infile:
+        lines = infile.readlines()
+
+    page = Page(lines=columns.parse_column(lines, name), name=name)
+
+    return "\n".join(page.content), page.get_letters_in_page()[0]
+
+
+def _get_per_call_microseconds(content: str, letter: str) -> float:
+    timer = timeit.Timer(lambda: segmenter.segment_entries(content, letter))
+    loops, _ = timer.autorange()
+    best = min(timer.repeat(repeat=5, number=loops))
+
+    return best / loops * 1_000_000
+
+
+def main() -> None:
+    print("Per page cost of segmenter.segment_entries:")
+
+    for file in _fixture_files:
+        content, letter = _read_page_content(file, FIXTURE_PAGES[file])
+        microseconds = _get_per_call_microseconds(content, letter)
+        print(f"  {file}: {microseconds:.1f} µs ({len(content)} chars)")
+
+    # Cost per headword should stay flat as pages grow.
+    print("Cost per headword on synthetic pages:")
+
+    for headwords in [100, 1_000, 10_000]:
+        content = "af bar. " + "Afkom, no. efterkommere i Aalborg. " * headwords
+        microseconds = _get_per_call_microseconds(content, "A")
+        print(f"  {headwords} headwords: {microseconds / headwords:.3f} µs")
+
+
+if __name__ == "__main__":
+    main()
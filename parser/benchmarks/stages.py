@@ -0,0 +1,224 @@
+"""
+Per-stage benchmarks for parser hot paths.
+
+Run inside the parser folder:
+
+    python3 -m benchmarks.stages                      # Fixture pages in tests/test_data
+    python3 -m benchmarks.stages --corpus resources/text --rounds 1
+    python3 -m benchmarks.stages --output after.json --compare before.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+from typing import Any, Callable, Final, Iterable, TypeVar
+
+from src.parser import columns, instrumentation, reader, segmenter, writer
+from src.parser.dictionary import Dictionary, DictionaryPage, _get_pages
+from src.parser.entry import Entry
+from src.parser.page import Page
+
+T = TypeVar("T")
+
+test_data_folder: Final[str] = "tests/test_data"
+
+# Fixture pages & names of the pages they were read from.
+FIXTURE_PAGES: Final[dict[str, str]] = {
+    "first-page.txt": "0-abbot.txt",
+    "simple-page.txt": "19-afklappe.txt",
+    "simple-page-linebreaks.txt": "20-afkyndige.txt",
+    "simple-page-irregular-meta-line.txt": "71-arbejdelse.txt",
+    "split-a-to-b.txt": "87-axelkøbstad.txt",
+    "simple-page-rotated-for-better-ocr.txt": "97-balstyrig.txt",
+    "split-e-to-f.txt": "484-fabel.txt",
+    "irregular-meta-split-page.txt": "962-gørrel.txt",
+    "simple-page-rotated-for-better-ocr2.txt": "1109-hosskrift.txt",
+    "irregular-meta-number-words-number.txt": "1138-husbrand.txt",
+    "irregular-meta-three-words.txt": "1233-indermere (inderst).txt",
+    "irregular-meta-sign-words-number.txt": "1549-kølve.txt",
+    "split-o-to-p.txt": "2172-øxentorv.txt",
+    "simple-page-rotated-for-better-ocr3.txt": "2387-røtte (rotte).txt",
+    "irregular-meta-unexpected-dash.txt": "2523-skinbarlig.txt",
+    "irregular-meta-unexpected-spacing.txt": "2530-skjudebane.txt",
+    "simple-page-rotated-for-better-ocr4.txt": "3021-timesand.txt",
+    "split-v-to-x.txt": "3554-vævel.txt",
+    "split-x-to-y.txt": "3555-ybisk.txt",
+    "split-y-continuation.txt": "3556-ydekorn.txt",
+}
+
+# Stages whose median changed less than this are reported as unchanged.
+_compare_threshold: Final[float] = 0.05
+
+
+def copy_fixtures_to_corpus(folder: str) -> None:
+    # Fixtures are named by their case, reader expects page names.
+    for file, name in FIXTURE_PAGES.items():
+        shutil.copyfile(
+            os.path.join(test_data_folder, file), os.path.join(folder, name)
+        )
+
+
+def _get_raw_entries(page: Page) -> list[tuple[str, list[str]]]:
+    letters = page.get_letters_in_page()
+    raw_entries = segmenter.segment_entries("\n".join(page.content), letters[0])
+
+    # Same filtering as in Page.get_entries.
+    return [
+        (raw_entry, letters)
+        for raw_entry in raw_entries
+        if len(raw_entry.replace("\n", "")) > 1
+    ]
+
+
+def _measure(
+    function: Callable[[T], Any], inputs: Iterable[T], rounds: int
+) -> dict[str, float]:
+    inputs = list(inputs)
+    samples: list[int] = []
+
+    for _ in range(rounds):
+        for value in inputs:
+            start = time.perf_counter_ns()
+            function(value)
+            samples.append(time.perf_counter_ns() - start)
+
+    total_seconds = sum(samples) / 1_000_000_000
+
+    return {
+        "calls": len(samples),
+        "ops_per_sec": len(samples) / total_seconds if total_seconds else 0.0,
+        "mean_us": statistics.fmean(samples) / 1_000,
+        **instrumentation.get_latency_percentiles(samples),
+    }
+
+
+def run_benchmarks(corpus: str, rounds: int) -> dict[str, dict[str, float]]:
+    pages = reader.read_files(corpus)
+    dictionary_pages = [DictionaryPage(name=name, lines=lines) for name, lines in pages]
+    parsed_pages = [
+        page
+        for dictionary_page in dictionary_pages
+        for page in _get_pages(dictionary_page)
+    ]
+    raw_entries = [raw for page in parsed_pages for raw in _get_raw_entries(page)]
+    entries = [entry for page in parsed_pages for entry in page.get_entries()]
+    merged_entries = Dictionary(dictionary_pages).get_entries()
+
+    return {
+        "reader.read_files": _measure(reader.read_files, [corpus], rounds),
+        "columns.parse_column": _measure(
+            lambda page: columns.parse_column(page.lines, page.name),
+            dictionary_pages,
+            rounds,
+        ),
+        "Page._proofread_lines": _measure(
+            lambda page: page._proofread_lines(list(page._raw_content)),
+            parsed_pages,
+            rounds,
+        ),
+        # Entries are kept in page after first call, measure parsing itself.
+        "Page.get_entries": _measure(Page._parse_entries, parsed_pages, rounds),
+        "Entry.from_raw_entry": _measure(
+            lambda raw: Entry.from_raw_entry(raw[0], raw[1]), raw_entries, rounds
+        ),
+        "Entry.definitions_list": _measure(
+            lambda entry: entry.definitions_list, entries, rounds
+        ),
+        "Dictionary.get_entries": _measure(
+            lambda pages: Dictionary(pages).get_entries(), [dictionary_pages], rounds
+        ),
+        "writer.write_entries_to_json": _measure(
+            lambda entries: writer.write_entries_to_json(entries, io.StringIO()),
+            [merged_entries],
+            rounds,
+        ),
+    }
+
+
+def _print_results(results: dict[str, dict[str, float]]) -> None:
+    print(
+        f"{'stage':<30} {'calls':>8} {'ops/sec':>12} "
+        f"{'p50 µs':>10} {'p90 µs':>10} {'p99 µs':>10}"
+    )
+
+    for stage, result in results.items():
+        print(
+            f"{stage:<30} {result['calls']:>8} {result['ops_per_sec']:>12.1f} "
+            f"{result['p50_us']:>10.1f} {result['p90_us']:>10.1f} {result['p99_us']:>10.1f}"
+        )
+
+
+def _print_comparison(
+    results: dict[str, dict[str, float]], previous: dict[str, dict[str, float]]
+) -> None:
+    print("\nMedian compared to previous run:")
+
+    for stage, result in results.items():
+        if stage not in previous:
+            print(f"{stage:<30} new stage")
+            continue
+
+        ratio = result["p50_us"] / previous[stage]["p50_us"]
+
+        if ratio < 1 - _compare_threshold:
+            verdict = "faster"
+        elif ratio > 1 + _compare_threshold:
+            verdict = "slower"
+        else:
+            verdict = "unchanged"
+
+        print(f"{stage:<30} {ratio:>6.2f}x time, {verdict}")
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Benchmark parser stages.")
+    arg_parser.add_argument(
+        "--corpus",
+        help="Folder of page text files. Defaults to fixture pages of tests.",
+    )
+    arg_parser.add_argument("--rounds", type=int, default=5)
+    arg_parser.add_argument("--output", help="Save results as JSON to this file.")
+    arg_parser.add_argument("--compare", help="JSON results of a previous run.")
+    args = arg_parser.parse_args()
+
+    # Parser reports oddities of pages to stdout, keep them out of results.
+    with contextlib.redirect_stdout(io.StringIO()):
+        if args.corpus:
+            corpus = args.corpus
+            results = run_benchmarks(corpus, args.rounds)
+        else:
+            corpus = test_data_folder
+
+            with tempfile.TemporaryDirectory() as folder:
+                copy_fixtures_to_corpus(folder)
+                results = run_benchmarks(folder, args.rounds)
+
+    _print_results(results)
+
+    if args.compare:
+        with open(args.compare, "r") as infile:
+            _print_comparison(results, json.load(infile)["stages"])
+
+    if args.output:
+        with open(args.output, "w") as outfile:
+            json.dump(
+                {
+                    "corpus": corpus,
+                    "rounds": args.rounds,
+                    "python": platform.python_version(),
+                    "stages": results,
+                },
+                outfile,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
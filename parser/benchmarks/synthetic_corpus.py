@@ -0,0 +1,282 @@
+"""
+Generate synthetic OCR'd pages in the layout the parser expects,
+for measuring how parsing scales beyond the size of the real book.
+
+Run inside the parser folder:
+
+    python3 -m benchmarks.synthetic_corpus /tmp/corpus --pages 36880
+    python3 -m benchmarks.stages --corpus /tmp/corpus --rounds 1
+"""
+
+import argparse
+import os
+import random
+from typing import Final, Iterator, NamedTuple
+
+# Letters of headwords, in order of the book.
+LETTERS: Final[str] = "ABCDEFGHIJKLMNOPRSTUVXYÆØÅ"
+
+SYLLABLES: Final[list[str]] = [
+    "af",
+    "bar",
+    "dom",
+    "el",
+    "ge",
+    "hold",
+    "hus",
+    "kar",
+    "ke",
+    "ling",
+    "lse",
+    "mand",
+    "ne",
+    "ord",
+    "rig",
+    "skab",
+    "sted",
+    "te",
+    "ved",
+    "vej",
+]
+
+WORDS: Final[list[str]] = [
+    "at",
+    "oc",
+    "the",
+    "som",
+    "hand",
+    "met",
+    "komme",
+    "bort",
+    "fra;",
+    "kirke",
+    "skulle",
+    "haffue",
+    "gods,",
+    "borgemester",
+    "kongens",
+    "breff",
+    "(1542).",
+    "smlgn.",
+    "jf.",
+    "ovf.",
+]
+
+GRAMMAR: Final[list[str]] = ["no.", "go.", "adj.", "adv.", "part."]
+
+SOURCES: Final[list[str]] = [
+    "Moth.",
+    "Saxo.",
+    "Herlufsh.",
+    "Fritzner.",
+    "Hvitf. VIII 365.",
+    "D. Mag. IV. 288.",
+]
+
+DIVIDERS: Final[list[str]] = [" | ", " | ", " | ", " | ", " ! ", "   "]
+
+# Common OCR misreads.
+NOISE: Final[list[tuple[str, str]]] = [
+    ("e", "c"),
+    ("l", "1"),
+    ("o", "0"),
+    ("m", "rn"),
+    ("å", "a"),
+    ("ø", "o"),
+]
+
+
+class SyntheticPage(NamedTuple):
+    name: str
+    lines: list[str]
+    # Headwords starting in page, as parser should read them.
+    headwords: list[str]
+
+
+class SyntheticCorpus:
+    """
+    Pages of one letter follow each other, entries flow from column to
+    column and from page to page like in the book.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        split_rate: float = 0.05,
+        noise_rate: float = 0.01,
+        lines_per_column: int = 54,
+        column_width: int = 36,
+    ) -> None:
+        self._random = random.Random(seed)
+        self._split_rate = split_rate
+        self._noise_rate = noise_rate
+        self._lines_per_column = lines_per_column
+        self._column_width = column_width
+
+    def _get_headword(self, letter: str) -> str:
+        syllables = self._random.choices(SYLLABLES, k=self._random.randint(1, 3))
+        return letter + "".join(syllables)
+
+    def _get_definitions(self) -> Iterator[str]:
+        yield self._random.choice(GRAMMAR)
+
+        senses = self._random.choice([1, 1, 1, 2, 3, 4])
+
+        for sense in range(1, senses + 1):
+            if senses > 1:
+                yield f"{sense})"
+
+            yield from self._random.choices(WORDS, k=self._random.randint(4, 30))
+            yield self._random.choice(SOURCES)
+
+            if sense < senses:
+                yield "—"
+
+    def _add_noise(self, word: str) -> str:
+        if self._random.random() >= self._noise_rate:
+            return word
+
+        for search, replace in self._random.sample(NOISE, len(NOISE)):
+            if search in word:
+                return word.replace(search, replace, 1)
+
+        return word
+
+    def _get_words(self, letter: str) -> Iterator[tuple[str, str | None]]:
+        """
+        Words of entries. Headwords are also yielded as is, for naming pages.
+        Headwords to be split over lines are yielded as two words, first ending in dash.
+        """
+        while True:
+            headword = self._get_headword(letter)
+
+            if len(headword) > 3 and self._random.random() < self._split_rate:
+                split_at = self._random.randint(2, len(headword) - 1)
+                yield f"{headword[:split_at]}-", headword
+                yield f"{headword[split_at:]},", None
+            else:
+                yield f"{headword},", headword
+
+            for word in self._get_definitions():
+                yield self._add_noise(word), None
+
+            yield "—", None
+
+    def _get_columns(
+        self, words: Iterator[tuple[str, str | None]]
+    ) -> tuple[list[str], list[str]]:
+        lines: list[str] = []
+        headwords: list[str] = []
+        line: list[str] = []
+        line_length = 0
+
+        while len(lines) < self._lines_per_column * 2:
+            word, headword = next(words)
+
+            if headword:
+                headwords.append(headword)
+
+            line.append(word)
+            line_length += len(word) + 1
+
+            # Split headwords always continue on next line.
+            if line_length >= self._column_width or word.endswith("-"):
+                lines.append(" ".join(line))
+                line = []
+                line_length = 0
+
+        return lines, headwords
+
+    def _join_columns(self, lines: list[str]) -> list[str]:
+        left = lines[: self._lines_per_column]
+        right = lines[self._lines_per_column :]  # noqa: E203
+
+        joined = []
+
+        for left_line, right_line in zip(left, right):
+            divider = self._random.choice(DIVIDERS)
+
+            if self._random.random() < self._noise_rate:
+                # Divider was not read at all.
+                divider = " "
+
+            joined.append(f"{left_line}{divider}{right_line}\n")
+
+        return joined
+
+    def generate(self, pages: int) -> Iterator[SyntheticPage]:
+        """
+        Yields pages named like real pages, in order.
+        """
+        pages_per_letter = max(1, pages // len(LETTERS))
+
+        page_number = 0
+
+        for letter_index, letter in enumerate(LETTERS):
+            words = self._get_words(letter)
+
+            # Last letter takes the rounding leftovers.
+            letter_pages = (
+                pages - page_number
+                if letter_index == len(LETTERS) - 1
+                else min(pages_per_letter, pages - page_number)
+            )
+
+            for _ in range(letter_pages):
+                lines, headwords = self._get_columns(words)
+
+                # Page may be all continuation of previous entry.
+                first = headwords[0] if headwords else self._get_headword(letter)
+                last = headwords[-1] if headwords else first
+
+                meta = f"{page_number + 1}{' ' * 20}{first}— {last}\n"
+                name = f"{page_number}-{first.lower()}.txt"
+
+                yield SyntheticPage(
+                    name=name,
+                    lines=[meta] + self._join_columns(lines),
+                    headwords=headwords,
+                )
+
+                page_number += 1
+
+
+def write_corpus(folder: str, pages: int, corpus: SyntheticCorpus) -> None:
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+
+    for page in corpus.generate(pages):
+        with open(os.path.join(folder, page.name), "w") as outfile:
+            outfile.writelines(page.lines)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Generate synthetic pages.")
+    arg_parser.add_argument("folder", help="Folder to write pages to.")
+    arg_parser.add_argument("--pages", type=int, default=3688)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument(
+        "--split-rate",
+        type=float,
+        default=0.05,
+        help="Share of headwords split over two lines.",
+    )
+    arg_parser.add_argument(
+        "--noise-rate",
+        type=float,
+        default=0.01,
+        help="Share of words & column dividers misread.",
+    )
+    args = arg_parser.parse_args()
+
+    write_corpus(
+        args.folder,
+        args.pages,
+        SyntheticCorpus(
+            seed=args.seed, split_rate=args.split_rate, noise_rate=args.noise_rate
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
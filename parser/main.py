@@ -1,12 +1,225 @@
-from src.parser import writer
+import argparse
+import os
+
+from src.parser import instrumentation, search_replace, writer
+from src.parser.cache import PageCache
 from src.parser.dictionary import Dictionary, DictionaryPage
+from src.parser.manifest import Manifest
+from src.parser.watch import Watcher
 from src.parser import reader
 
-pages = reader.read_files()
 
+def _parse_page_numbers(value: str) -> range:
+    first, _, last = value.partition("-")
+
+    try:
+        return range(int(first), int(last or first) + 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected page range like 1400-1560: {value}")
+
+
+arg_parser = argparse.ArgumentParser(description="Parse OCR'd pages to JSON.")
+arg_parser.add_argument(
+    "--workers",
+    type=int,
+    default=os.cpu_count() or 1,
+    help="Amount of processes to parse pages with. 1 parses serially.",
+)
+arg_parser.add_argument(
+    "--stream",
+    action="store_true",
+    help="Read & parse pages lazily, one at a time, instead of all up front.",
+)
+arg_parser.add_argument(
+    "--pack",
+    action="store_true",
+    help="Bundle pages to resources/text.pack for faster reading & exit.",
+)
+arg_parser.add_argument(
+    "--from-pack",
+    action="store_true",
+    help="Read pages from resources/text.pack instead of separate files.",
+)
+arg_parser.add_argument(
+    "--letters",
+    nargs="+",
+    type=str.upper,
+    help="Only build pages with headwords of given letters, eg. --letters K L.",
+)
+arg_parser.add_argument(
+    "--pages",
+    type=_parse_page_numbers,
+    metavar="FIRST-LAST",
+    help="Only build pages of given number range, eg. --pages 1400-1560.",
+)
+arg_parser.add_argument(
+    "--watch",
+    action="store_true",
+    help="Keep running & rewrite JSON whenever pages or parsing rules change.",
+)
+arg_parser.add_argument(
+    "--compact",
+    action="store_true",
+    help="Write JSON without indentation & whitespace.",
+)
+arg_parser.add_argument(
+    "--senses",
+    action="store_true",
+    help="Also write definitions as structured senses with sub-senses & sources.",
+)
+arg_parser.add_argument(
+    "--cache",
+    action="store_true",
+    help="Reuse parsed entries of pages & rules unchanged since previous build.",
+)
+arg_parser.add_argument(
+    "--binary",
+    action="store_true",
+    help="Also write memory-mappable binary dictionary to dictionary.bin.",
+)
+arg_parser.add_argument(
+    "--sqlite",
+    action="store_true",
+    help="Also write SQLite database with full-text index to dictionary.sqlite.",
+)
+arg_parser.add_argument(
+    "--tokens",
+    action="store_true",
+    help="Also write token-compressed binary dictionary to dictionary.tokens.",
+)
+arg_parser.add_argument(
+    "--shards",
+    action="store_true",
+    help="Also write one JSON file per headword letter & their manifest to shards/.",
+)
+arg_parser.add_argument(
+    "--columnar",
+    action="store_true",
+    help="Also write columnar JSON with deduplicated definitions to dictionary.columnar.json.",
+)
+arg_parser.add_argument(
+    "--compress",
+    choices=writer.COMPRESSIONS,
+    help="Compress JSON & shards while writing them, eg. to dictionary.json.gz.",
+)
+arg_parser.add_argument(
+    "--compression-level",
+    type=int,
+    choices=range(10),
+    metavar="0-9",
+    help="Level of compression, defaults to 6.",
+)
+arg_parser.add_argument(
+    "--profile",
+    type=int,
+    metavar="PAGES",
+    help="Report time of parsing stages, given amount of slowest pages & "
+    "search/replace rules fired per page.",
+)
+
+
+def _check_args(args: argparse.Namespace) -> None:
+    is_selective = args.letters is not None or args.pages is not None
+
+    if is_selective and (args.stream or args.from_pack):
+        arg_parser.error("--letters & --pages select page files by manifest")
+
+    if args.watch and (is_selective or args.stream or args.from_pack):
+        arg_parser.error("--watch builds all page files")
+
+    if args.watch and (
+        args.binary
+        or args.sqlite
+        or args.tokens
+        or args.shards
+        or args.columnar
+        or args.compress
+        or args.profile is not None
+    ):
+        arg_parser.error("--watch only writes JSON")
+
+
+def _get_dictionary(args: argparse.Namespace) -> Dictionary:
+    is_selective = args.letters is not None or args.pages is not None
+    # Selective builds keep cached pages they did not touch.
+    cache = PageCache(prune=not is_selective) if args.cache else None
+
+    if is_selective:
+        return Dictionary(
+            dictionary_pages=Manifest().select(
+                page_numbers=args.pages, letters=args.letters
+            ),
+            workers=args.workers,
+            cache=cache,
+        )
+
+    files = reader.iter_pack() if args.from_pack else reader.iter_files()
+
+    if args.stream:
+        return Dictionary(
+            dictionary_pages=(
+                DictionaryPage(name=name, lines=lines) for name, lines in files
+            ),
+            workers=args.workers,
+            stream=True,
+            cache=cache,
+        )
+
+    dictionary_pages = [DictionaryPage(name=name, lines=lines) for name, lines in files]
+
+    return Dictionary(
+        dictionary_pages=dictionary_pages, workers=args.workers, cache=cache
+    )
+
+
+def _write_dictionary(dictionary: Dictionary, args: argparse.Namespace) -> None:
+    compression_suffix = writer.COMPRESSIONS[args.compress] if args.compress else ""
+
+    writer.write_dictionary_to_files(
+        dictionary,
+        json_file_path=f"dictionary.json{compression_suffix}",
+        pretty=not args.compact,
+        senses=args.senses,
+        binary_file_path="dictionary.bin" if args.binary else None,
+        sqlite_file_path="dictionary.sqlite" if args.sqlite else None,
+        tokens_file_path="dictionary.tokens" if args.tokens else None,
+        shards_folder_path="shards" if args.shards else None,
+        columnar_file_path=(
+            f"dictionary.columnar.json{compression_suffix}" if args.columnar else None
+        ),
+        compression=args.compress,
+        compression_level=args.compression_level,
+        workers=args.workers,
+    )
+
+
+def main() -> None:
+    args = arg_parser.parse_args()
+    _check_args(args)
+
+    if args.pack:
+        print(f"Packed {reader.pack_files()} pages to {reader.pack_file}")
+        return
+
+    if args.profile is not None:
+        # Timings are collected per process, so profile in one.
+        instrumentation.enable()
+        args.workers = 1
+
+    if args.watch:
+        Watcher(pretty=not args.compact, senses=args.senses).watch()
+        return
+
+    dictionary = _get_dictionary(args)
+    _write_dictionary(dictionary, args)
 
-dictionary_pages = [DictionaryPage(name=name, lines=lines) for name, lines in pages]
+    if args.profile is not None:
+        print(instrumentation.get_report(slowest_pages=args.profile))
+        print()
+        print(search_replace.get_report(dictionary.get_fired_search_replaces()))
 
-dictionary = Dictionary(dictionary_pages=dictionary_pages)
 
-writer.write_dictionary_to_json_file(dictionary)
+# Pool workers of spawn start method import this module, so build only
+# when run as a script.
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import argparse
+import asyncio
+
+from src.parser.lookup import HeadwordIndex
+from src.parser.server import LookupServer
+
+arg_parser = argparse.ArgumentParser(description="Serve lookups of built dictionary.")
+arg_parser.add_argument(
+    "--file",
+    default="dictionary.json",
+    help="Dictionary JSON written by main.py.",
+)
+arg_parser.add_argument("--host", default="127.0.0.1", help="Address to listen at.")
+arg_parser.add_argument("--port", type=int, default=8000, help="Port to listen at.")
+arg_parser.add_argument(
+    "--cache-size",
+    type=int,
+    default=4096,
+    help="Amount of lookup results to keep in each LRU cache.",
+)
+args = arg_parser.parse_args()
+
+index = HeadwordIndex.from_json_file(args.file)
+print(f"Serving {len(index)} entries at http://{args.host}:{args.port}")
+
+try:
+    asyncio.run(
+        LookupServer(index, cache_size=args.cache_size).serve_forever(
+            args.host, args.port
+        )
+    )
+except KeyboardInterrupt:
+    pass
@@ -0,0 +1,142 @@
+"""
+Binary dictionary format, all integers little-endian:
+
+    header:  magic (4 bytes), version (u32), entry count (u32)
+    table:   entry count * (headword offset, headword length,
+             definitions offset, definitions length), all u32,
+             sorted by UTF-8 bytes of headwords
+    heap:    UTF-8 headwords & definitions as compact JSON arrays
+
+Offsets in table are relative to start of heap.
+"""
+
+import json
+import struct
+from typing import IO, Final
+
+from src.parser import instrumentation
+from src.parser.entry import Entry
+from src.parser.mapped_file import MappedFile, TemporaryHeap
+
+MAGIC: Final[bytes] = b"ODDB"
+VERSION: Final[int] = 1
+
+_header: Final[struct.Struct] = struct.Struct("<4sII")
+_table_row: Final[struct.Struct] = struct.Struct("<IIII")
+
+
+class BinaryEntryWriter:
+    """
+    Writes entries to binary dictionary. Definitions are written to temporary
+    heap as entries come in, only headwords & offsets are kept in memory.
+    """
+
+    _binary_file: IO[bytes]
+    _heap: TemporaryHeap
+    _rows: list[tuple[bytes, int, int, int, int]]
+
+    def __init__(self, binary_file: IO[bytes]) -> None:
+        self._binary_file = binary_file
+        self._heap = TemporaryHeap()
+        self._rows = []
+
+    @instrumentation.timed("writer.binary")
+    def write(self, entry: Entry) -> None:
+        headword = entry.headword.encode()
+        definitions = json.dumps(
+            entry.definitions_list, ensure_ascii=False, separators=(",", ":")
+        ).encode()
+
+        headword_offset = self._heap.write(headword)
+        definitions_offset = self._heap.write(definitions)
+
+        self._rows.append(
+            (
+                headword,
+                headword_offset,
+                len(headword),
+                definitions_offset,
+                len(definitions),
+            )
+        )
+
+    def finish(self) -> None:
+        # Stable sort: same headwords stay in dictionary order.
+        self._rows.sort(key=lambda row: row[0])
+
+        self._binary_file.write(_header.pack(MAGIC, VERSION, len(self._rows)))
+
+        for _, *offsets in self._rows:
+            self._binary_file.write(_table_row.pack(*offsets))
+
+        self._heap.copy_to(self._binary_file)
+
+
+class BinaryDictionary(MappedFile):
+    """
+    Read-only view to binary dictionary, looked up from memory-mapped file.
+    """
+
+    _count: int
+    _heap_start: int
+
+    def __init__(self, file_path: str) -> None:
+        (self._count,) = self._map(
+            file_path, _header, MAGIC, VERSION, "binary dictionary"
+        )
+        self._heap_start = _header.size + self._count * _table_row.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _get_row(self, index: int) -> tuple[int, int, int, int]:
+        row: tuple[int, int, int, int] = _table_row.unpack_from(
+            self._mmap, _header.size + index * _table_row.size
+        )
+        return row
+
+    def _get_headword_bytes(self, index: int) -> bytes:
+        headword_offset, headword_length, _, _ = self._get_row(index)
+        start = self._heap_start + headword_offset
+        return self._mmap[start : start + headword_length]  # noqa: E203
+
+    def _get_definitions(self, index: int) -> list[str]:
+        _, _, definitions_offset, definitions_length = self._get_row(index)
+        start = self._heap_start + definitions_offset
+        definitions: list[str] = json.loads(
+            self._mmap[start : start + definitions_length]  # noqa: E203
+        )
+        return definitions
+
+    def _find_first(self, headword: bytes) -> int:
+        low, high = 0, self._count
+
+        while low < high:
+            middle = (low + high) // 2
+
+            if self._get_headword_bytes(middle) < headword:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    def lookup(self, headword: str) -> list[dict[str, str | list[str]]]:
+        """
+        All entries with exactly matching headword, in dictionary order.
+        Entries are in same form as in JSON output.
+        """
+        encoded_headword = headword.encode()
+        entries: list[dict[str, str | list[str]]] = []
+
+        index = self._find_first(encoded_headword)
+
+        while (
+            index < self._count and self._get_headword_bytes(index) == encoded_headword
+        ):
+            entries.append(
+                {"headword": headword, "definitions": self._get_definitions(index)}
+            )
+            index += 1
+
+        return entries
@@ -0,0 +1,135 @@
+import hashlib
+import os
+import pickle
+from types import ModuleType
+from typing import Final
+
+from src.parser import (
+    columns,
+    entry,
+    page,
+    page_splitter,
+    search_replace,
+    segmenter,
+    senses,
+)
+from src.parser.page import ParsedPage
+from src.parser.page_meta import PageMeta
+
+cache_file: Final[str] = "resources/cache/pages.pickle"
+
+# Bump when format of cached pages changes.
+_cache_version: Final[str] = "3"
+
+# Modules whose logic (or global rule tables, like headword typos) apply to every page.
+_parsing_modules: Final[list[ModuleType]] = [
+    columns,
+    entry,
+    page,
+    page_splitter,
+    search_replace,
+    segmenter,
+    senses,
+]
+
+
+def _get_parsing_fingerprint() -> bytes:
+    fingerprint = hashlib.sha256(_cache_version.encode())
+
+    for module in _parsing_modules:
+        assert module.__file__, f"Missing source for {module.__name__}"
+
+        with open(module.__file__, "rb") as source:
+            fingerprint.update(source.read())
+
+    return fingerprint.digest()
+
+
+def _get_page_rules_fingerprint(name: str) -> bytes:
+    # Page specific rules, so that editing rules of one page
+    # only invalidates that page. Plan includes global rules too.
+    return repr(PageMeta.get_page_plan(name)).encode()
+
+
+class PageCache:
+    """
+    On-disk cache of parsed entries & fired search/replaces per page, keyed by
+    content of the page and parsing rules that apply to it. Cross-page merging
+    is not cached.
+    """
+
+    _file_path: str
+    _pages: dict[str, ParsedPage]
+    _used_keys: set[str]
+    autosave: bool
+    prune: bool
+    _parsing_fingerprint: bytes
+
+    def __init__(
+        self, file_path: str = cache_file, autosave: bool = True, prune: bool = True
+    ) -> None:
+        """
+        Without autosave, cache is only saved when asked to, not after each build.
+        Without prune, pages not seen in build are kept, for builds of only
+        some of the pages.
+        """
+        self._file_path = file_path
+        self.autosave = autosave
+        self.prune = prune
+        self._pages = self._load()
+        self._used_keys = set()
+        self._parsing_fingerprint = _get_parsing_fingerprint()
+
+    def _load(self) -> dict[str, ParsedPage]:
+        if not os.path.exists(self._file_path):
+            return {}
+
+        try:
+            with open(self._file_path, "rb") as infile:
+                pages: dict[str, ParsedPage] = pickle.load(infile)
+                return pages
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Unreadable or outdated cache, start from scratch.
+            return {}
+
+    def get_key(self, name: str, lines: list[str]) -> str:
+        key = hashlib.sha256(self._parsing_fingerprint)
+        key.update(_get_page_rules_fingerprint(name))
+        key.update(name.encode())
+        key.update(b"\0")
+
+        for line in lines:
+            key.update(line.encode())
+
+        return key.hexdigest()
+
+    def get(self, name: str, lines: list[str]) -> ParsedPage | None:
+        key = self.get_key(name, lines)
+        self._used_keys.add(key)
+
+        return self._pages.get(key)
+
+    def set(self, name: str, lines: list[str], parsed_page: ParsedPage) -> None:
+        key = self.get_key(name, lines)
+        self._used_keys.add(key)
+        self._pages[key] = parsed_page
+
+    def save(self) -> None:
+        # Drop pages not seen in this build, so that cache does not grow forever.
+        pages = (
+            {
+                key: parsed_page
+                for key, parsed_page in self._pages.items()
+                if key in self._used_keys
+            }
+            if self.prune
+            else self._pages
+        )
+
+        folder = os.path.dirname(self._file_path)
+
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
+
+        with open(self._file_path, "wb") as outfile:
+            pickle.dump(pages, outfile, protocol=pickle.HIGHEST_PROTOCOL)
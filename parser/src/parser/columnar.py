@@ -0,0 +1,109 @@
+"""
+Columnar JSON format of dictionary, for clients parsing the whole of it:
+
+    {
+      "version": 1,
+      "strings": [unique definitions],
+      "headwords": [headword of each entry],
+      "definitions": [index to strings of each definition, in entry order],
+      "offsets": [start of each entry in definitions, end of last entry]
+    }
+
+Definitions of entry i are definitions[offsets[i]:offsets[i + 1]]. Keys are
+not repeated per entry, and definitions repeated between entries, like
+"no." of entries without other definitions, are stored once.
+"""
+
+import json
+from typing import Final, Iterator, TextIO
+
+from src.parser import instrumentation
+from src.parser.entry import Entry
+
+VERSION: Final[int] = 1
+
+
+class ColumnarEntryWriter:
+    """
+    Collects entries to columns, which are written once all entries are in.
+    """
+
+    _json_file: TextIO
+    _strings: dict[str, int]
+    _headwords: list[str]
+    _definitions: list[int]
+    _offsets: list[int]
+
+    def __init__(self, json_file: TextIO) -> None:
+        self._json_file = json_file
+        self._strings = {}
+        self._headwords = []
+        self._definitions = []
+        self._offsets = [0]
+
+    @instrumentation.timed("writer.columnar")
+    def write(self, entry: Entry) -> None:
+        # Same definitions as in Entry.to_json.
+        self._headwords.append(entry.headword)
+
+        for definition in entry.definitions_list:
+            self._definitions.append(
+                self._strings.setdefault(definition, len(self._strings))
+            )
+
+        self._offsets.append(len(self._definitions))
+
+    def finish(self) -> None:
+        json.dump(
+            {
+                "version": VERSION,
+                # Dicts keep insertion order, which is order of indexes.
+                "strings": list(self._strings),
+                "headwords": self._headwords,
+                "definitions": self._definitions,
+                "offsets": self._offsets,
+            },
+            self._json_file,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+
+class ColumnarDictionary:
+    """
+    Columnar dictionary read in memory. Entries are rebuilt on demand,
+    in the form of Entry.to_json.
+    """
+
+    _strings: list[str]
+    _headwords: list[str]
+    _definitions: list[int]
+    _offsets: list[int]
+
+    def __init__(self, json_file: TextIO) -> None:
+        columns = json.load(json_file)
+
+        if not isinstance(columns, dict) or columns.get("version") != VERSION:
+            raise ValueError(f"Not a columnar dictionary of version {VERSION}")
+
+        self._strings = columns["strings"]
+        self._headwords = columns["headwords"]
+        self._definitions = columns["definitions"]
+        self._offsets = columns["offsets"]
+
+    def __len__(self) -> int:
+        return len(self._headwords)
+
+    def get_entry(self, index: int) -> dict[str, str | list[str]]:
+        start, end = self._offsets[index], self._offsets[index + 1]
+
+        return {
+            "headword": self._headwords[index],
+            "definitions": [
+                self._strings[string] for string in self._definitions[start:end]
+            ],
+        }
+
+    def iter_entries(self) -> Iterator[dict[str, str | list[str]]]:
+        for index in range(len(self)):
+            yield self.get_entry(index)
@@ -1,11 +1,15 @@
 from typing import Final
 
-from src.parser.page_meta import PageMeta
+from src.parser import instrumentation
+from src.parser.page_meta import PageMeta, PagePlan
 
 _vertical_divider: Final[str] = "|"
 _exlamation_divider: Final[str] = " ! "
 _spaces_divider: Final[str] = "   "
 
+# How far from the middle of line a gap between words is looked for.
+_gutter_search_width: Final[int] = 15
+
 
 def _get_column_divider(line: str) -> str | None:
     if _vertical_divider in line:
@@ -27,11 +31,26 @@ def _get_column_divider(line: str) -> str | None:
     return None
 
 
-def _get_divided_lines(page: str, line: str) -> list[str]:
-    # Check page for known exceptions in lines.
-    exceptions = PageMeta.get_custom_column_breaks(page)
+def _get_gutter(line: str) -> int:
+    """
+    Split point of line without divider: the space closest to the middle.
+    Character positions of the columns vary from line to line, as OCR'd text is
+    not monospaced, but the gap between columns is close to the middle.
+    """
+    middle = len(line) // 2
+
+    for distance in range(_gutter_search_width + 1):
+        for index in (middle - distance, middle + distance):
+            if 0 < index < len(line) and line[index] == " ":
+                return index
 
-    for exception in exceptions:
+    # No gaps at all, cut in the middle.
+    return middle
+
+
+def _get_divided_lines(plan: PagePlan, line: str) -> list[str]:
+    # Check page for known exceptions in lines.
+    for exception in plan.column_breaks:
         if exception[0] in line:
             return [line[: exception[1]], line[exception[1] :]]  # noqa: E203
 
@@ -50,23 +69,23 @@ def _get_divided_lines(page: str, line: str) -> list[str]:
         return divided
 
     # No clear divider available. Most likely issue of OCR not reading it correctly.
-    # Our best bet: divide it in the middle. Sometimes there are two spaces there,
-    # but there are more exotic scenarios too. For now, lets see how far we get with
-    # just division down the middle. Based on small sample size it is accurate enough
-    # not to break entries, but will cause some typos along the way.
-    return [line[: len(line) // 2], line[len(line) // 2 :]]  # noqa: E203
+    # Our best bet: divide it near the middle, at a gap between words.
+    gutter = _get_gutter(line)
+    return [line[:gutter], line[gutter:]]
 
 
+@instrumentation.timed("columns.parse_column")
 def parse_column(page: list[str], name: str) -> list[str]:
     left_column = []
     right_column = []
 
-    meta_line_index = PageMeta.get_meta_line_index(name=name)
+    plan = PageMeta.get_page_plan(name)
+    meta_line_index = plan.meta_line_index
     content_start_index = meta_line_index + 1  # Dont parse meta into columns.
 
     for line in page[content_start_index:]:
         if len(line) > 20:  # Skip letter headings and oddities.
-            divided = _get_divided_lines(name, line)
+            divided = _get_divided_lines(plan, line)
 
             match len(divided):
                 case 0:
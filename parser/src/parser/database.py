@@ -0,0 +1,136 @@
+import os
+import sqlite3
+from typing import Final
+
+from src.parser import instrumentation
+from src.parser.entry import Entry
+
+# Rows are inserted with executemany in batches of this size.
+_batch_size: Final[int] = 10_000
+
+_schema: Final[str] = """
+CREATE TABLE entries (
+    id INTEGER PRIMARY KEY,
+    headword TEXT NOT NULL
+);
+
+CREATE TABLE senses (
+    id INTEGER PRIMARY KEY,
+    entry_id INTEGER NOT NULL REFERENCES entries (id),
+    position INTEGER NOT NULL,
+    definition TEXT NOT NULL
+);
+
+CREATE VIRTUAL TABLE senses_fts USING fts5 (
+    definition,
+    content = 'senses',
+    content_rowid = 'id'
+);
+"""
+
+# Indexes are cheaper to build once all rows are in.
+_indexes: Final[str] = """
+CREATE INDEX entries_headword ON entries (headword);
+CREATE INDEX senses_entry_id ON senses (entry_id, position);
+INSERT INTO senses_fts (senses_fts) VALUES ('rebuild');
+"""
+
+
+class SqliteEntryWriter:
+    """
+    Loads entries to SQLite database with headword index and
+    full-text index over numbered senses of definitions.
+    """
+
+    _connection: sqlite3.Connection
+    _entry_rows: list[tuple[int, str]]
+    _sense_rows: list[tuple[int, int, str]]
+    _entry_id: int
+
+    def __init__(self, file_path: str) -> None:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+        self._connection = sqlite3.connect(file_path)
+
+        # Database is rebuilt from scratch on failure, no need for journaling.
+        self._connection.execute("PRAGMA journal_mode = OFF")
+        self._connection.execute("PRAGMA synchronous = OFF")
+        self._connection.executescript(_schema)
+
+        self._entry_rows = []
+        self._sense_rows = []
+        self._entry_id = 0
+
+    def _flush(self) -> None:
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO entries (id, headword) VALUES (?, ?)", self._entry_rows
+            )
+            self._connection.executemany(
+                "INSERT INTO senses (entry_id, position, definition) VALUES (?, ?, ?)",
+                self._sense_rows,
+            )
+
+        self._entry_rows.clear()
+        self._sense_rows.clear()
+
+    @instrumentation.timed("writer.sqlite")
+    def write(self, entry: Entry) -> None:
+        self._entry_id += 1
+        self._entry_rows.append((self._entry_id, entry.headword))
+        self._sense_rows.extend(
+            (self._entry_id, position, definition)
+            for position, definition in enumerate(entry.definitions_list)
+        )
+
+        if len(self._entry_rows) >= _batch_size:
+            self._flush()
+
+    def finish(self) -> None:
+        self._flush()
+        self._connection.executescript(_indexes)
+        self._connection.close()
+
+
+def lookup(connection: sqlite3.Connection, headword: str) -> list[list[str]]:
+    """
+    Definitions of all entries with given headword, in dictionary order.
+    """
+    rows = connection.execute(
+        """
+        SELECT entries.id, senses.definition FROM entries
+        JOIN senses ON senses.entry_id = entries.id
+        WHERE entries.headword = ?
+        ORDER BY entries.id, senses.position
+        """,
+        (headword,),
+    )
+
+    definitions: dict[int, list[str]] = {}
+
+    for entry_id, definition in rows:
+        definitions.setdefault(entry_id, []).append(definition)
+
+    return list(definitions.values())
+
+
+def search_definitions(
+    connection: sqlite3.Connection, query: str, limit: int = 100
+) -> list[tuple[str, str]]:
+    """
+    Headwords & senses matching FTS5 query, eg. "Moth" or "kirke NEAR præst".
+    """
+    rows: list[tuple[str, str]] = connection.execute(
+        """
+        SELECT entries.headword, senses.definition FROM senses_fts
+        JOIN senses ON senses.id = senses_fts.rowid
+        JOIN entries ON entries.id = senses.entry_id
+        WHERE senses_fts MATCH ?
+        ORDER BY senses.entry_id, senses.position
+        LIMIT ?
+        """,
+        (query, limit),
+    ).fetchall()
+
+    return rows
@@ -1,62 +1,313 @@
-from typing import NamedTuple
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterable, Iterator, NamedTuple
 
-from src.parser import columns
+from src.parser import columns, instrumentation
+from src.parser.cache import PageCache
 from src.parser.entry import Entry, EntryStatus
-from src.parser.page import Page
+from src.parser.page import Page, ParsedPage
 from src.parser.page_splitter import PageSplitter
 
 
 class DictionaryPage(NamedTuple):
     name: str
     lines: list[str]
+    # Selective builds parse neighbour page after selected pages only for
+    # entries continuing from them.
+    continuation_only: bool = False
+    # Continuing entries of pages after unselected ones can not be merged.
+    skip_continuation: bool = False
+
+
+def _get_pages(dictionary_page: DictionaryPage) -> list[Page]:
+    with instrumentation.page(dictionary_page.name):
+        if PageSplitter.is_split_page(dictionary_page.name):
+            page1, page2 = PageSplitter.split_page(
+                filename=dictionary_page.name, lines=dictionary_page.lines
+            )
+            return [page1, page2]
+
+        return [
+            Page(
+                lines=columns.parse_column(
+                    dictionary_page.lines, name=dictionary_page.name
+                ),
+                name=dictionary_page.name,
+            )
+        ]
+
+
+def _get_parsed_page(pages: list[Page]) -> ParsedPage:
+    fired_search_replaces: Counter[str] = Counter()
+
+    for page in pages:
+        fired_search_replaces.update(page.get_fired_search_replaces())
+
+    return ParsedPage(
+        entries=[entry for page in pages for entry in page.get_entries()],
+        fired_search_replaces=fired_search_replaces,
+    )
+
+
+def _parse_page(dictionary_page: DictionaryPage) -> ParsedPage:
+    # Runs in worker processes: top level so that it can be pickled.
+    with instrumentation.page(dictionary_page.name):
+        return _get_parsed_page(_get_pages(dictionary_page))
+
+
+def _trim_boundary_entries(
+    dictionary_page: DictionaryPage, entries: list[Entry]
+) -> list[Entry]:
+    if not (dictionary_page.continuation_only or dictionary_page.skip_continuation):
+        return entries
+
+    continuing = 0
+
+    while (
+        continuing < len(entries)
+        and entries[continuing].status == EntryStatus.PART_OF_PREVIOUS_ENTRY
+    ):
+        continuing += 1
+
+    if dictionary_page.continuation_only:
+        return entries[:continuing]
+
+    return entries[continuing:]
+
+
+def _merge_partial_entries(entries: Iterable[Entry]) -> Iterator[Entry]:
+    # Entry is held back until all of its partials, which may continue
+    # over several columns & pages, are collected. They are combined at once.
+    previous: Entry | None = None
+    partials: list[Entry] = []
+
+    for entry in entries:
+        if previous is not None and entry.status == EntryStatus.PART_OF_PREVIOUS_ENTRY:
+            partials.append(entry)
+            continue
+
+        if previous is not None:
+            yield Entry.combine_entries(previous, *partials) if partials else previous
+
+        previous = entry
+        partials = []
+
+    if previous is not None:
+        yield Entry.combine_entries(previous, *partials) if partials else previous
 
 
 class Dictionary:
-    _pages: list[Page]
-
-    def __init__(self, dictionary_pages: list[DictionaryPage]) -> None:
-        pages: list[Page] = []
-
-        for dictionary_page in dictionary_pages:
-            if PageSplitter.is_split_page(dictionary_page.name):
-                page1, page2 = PageSplitter.split_page(
-                    filename=dictionary_page.name, lines=dictionary_page.lines
-                )
-                pages.append(page1)
-                pages.append(page2)
-            else:
-                pages.append(
-                    Page(
-                        lines=columns.parse_column(
-                            dictionary_page.lines, name=dictionary_page.name
-                        ),
-                        name=dictionary_page.name,
-                    )
-                )
-
-        self._pages = pages
+    _dictionary_pages: Iterable[DictionaryPage]
+    _parsed_pages: dict[int, list[Page]]
+    _workers: int
+    _stream: bool
+    # Pages of stream can only be iterated once.
+    _is_streamed: bool
+    _cache: PageCache | None
+    _entries: list[Entry] | None
+    _fired_search_replaces: dict[str, Counter[str]]
 
-    def get_entries(self) -> list[Entry]:
-        entries = [entry for page in self._pages for entry in page.get_entries()]
-
-        # Combine partials to entries from previous pages.
-        for idx, entry in enumerate(entries):
-            if idx > 0:
-                if entry.status == EntryStatus.PART_OF_PREVIOUS_ENTRY:
-                    # Replace previous entry with combined entry, mark current entry for deletion.
-                    # Individual entries are immutable, so we're replacing them with new instances.
-                    entries[idx - 1] = Entry.combine_entries(entries[idx - 1], entry)
-                    entries[idx] = Entry.mark_for_deletion(entry)
-
-        filtered_entries = [
-            entry for entry in entries if entry.status != EntryStatus.DELETED
+    def __init__(
+        self,
+        dictionary_pages: Iterable[DictionaryPage],
+        workers: int = 1,
+        stream: bool = False,
+        cache: PageCache | None = None,
+    ) -> None:
+        """
+        Pages are parsed on demand, when their entries are first needed.
+
+        In stream mode pages are consumed lazily, one at a time, when entries
+        are iterated. Pages can then be a generator, but can only be iterated once:
+        iterating entries again raises ValueError, unless get_entries kept them.
+
+        With cache, only pages missing from the cache are parsed.
+        """
+        self._dictionary_pages = dictionary_pages if stream else list(dictionary_pages)
+        self._parsed_pages = {}
+        self._workers = workers
+        self._stream = stream
+        self._is_streamed = False
+        self._cache = cache
+        self._entries = None
+        self._fired_search_replaces = {}
+
+    def _get_page_index(self) -> list[DictionaryPage]:
+        if not isinstance(self._dictionary_pages, list):
+            raise ValueError("Pages of streamed dictionary can not be indexed")
+
+        return self._dictionary_pages
+
+    def get_page_count(self) -> int:
+        return len(self._get_page_index())
+
+    def get_dictionary_page(self, index: int) -> DictionaryPage:
+        return self._get_page_index()[index]
+
+    def get_pages(self, index: int) -> list[Page]:
+        """
+        Pages parsed from page file, split in two for pages of two letters.
+        Columns are parsed on first access only.
+        """
+        if index not in self._parsed_pages:
+            self._parsed_pages[index] = _get_pages(self.get_dictionary_page(index))
+
+        return self._parsed_pages[index]
+
+    def _get_cached_page(self, dictionary_page: DictionaryPage) -> ParsedPage | None:
+        if self._cache is None:
+            return None
+
+        return self._cache.get(dictionary_page.name, dictionary_page.lines)
+
+    def _set_cached_page(
+        self, dictionary_page: DictionaryPage, parsed_page: ParsedPage
+    ) -> None:
+        if self._cache is not None:
+            self._cache.set(dictionary_page.name, dictionary_page.lines, parsed_page)
+
+    def _iter_serial_parsed_pages(
+        self,
+    ) -> Iterator[tuple[DictionaryPage, ParsedPage]]:
+        for dictionary_page in self._dictionary_pages:
+            parsed_page = self._get_cached_page(dictionary_page)
+
+            if parsed_page is None:
+                parsed_page = _parse_page(dictionary_page)
+                self._set_cached_page(dictionary_page, parsed_page)
+
+            yield dictionary_page, parsed_page
+
+    def _iter_parallel_stream_parsed_pages(
+        self,
+    ) -> Iterator[tuple[DictionaryPage, ParsedPage]]:
+        # Keep only a handful of pages in flight, so that pages are
+        # still read lazily from the stream. Results are yielded in page order.
+        max_in_flight = self._workers * 2
+        in_flight: deque[tuple[DictionaryPage, Future[ParsedPage]]] = deque()
+
+        def _get_next_result() -> tuple[DictionaryPage, ParsedPage]:
+            dictionary_page, future = in_flight.popleft()
+            parsed_page = future.result()
+            self._set_cached_page(dictionary_page, parsed_page)
+            return dictionary_page, parsed_page
+
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            for dictionary_page in self._dictionary_pages:
+                parsed_page = self._get_cached_page(dictionary_page)
+
+                if parsed_page is None:
+                    future = executor.submit(_parse_page, dictionary_page)
+                else:
+                    # Cache hits wait in line, so that page order is kept.
+                    future = Future()
+                    future.set_result(parsed_page)
+
+                in_flight.append((dictionary_page, future))
+
+                if len(in_flight) >= max_in_flight:
+                    yield _get_next_result()
+
+            while in_flight:
+                yield _get_next_result()
+
+    def _iter_parallel_parsed_pages(
+        self,
+    ) -> Iterator[tuple[DictionaryPage, ParsedPage]]:
+        dictionary_pages = list(self._dictionary_pages)
+        cached_pages = [
+            self._get_cached_page(dictionary_page)
+            for dictionary_page in dictionary_pages
+        ]
+        uncached_pages = [
+            dictionary_page
+            for dictionary_page, parsed_page in zip(dictionary_pages, cached_pages)
+            if parsed_page is None
         ]
 
-        for entry in filtered_entries:
+        # Hand out pages in chunks to keep pickling overhead low,
+        # while still leaving enough chunks to balance the workers.
+        chunksize = max(1, len(uncached_pages) // (self._workers * 4))
+
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            # Map preserves page order, so merging partials works as in serial run.
+            parsed_pages = executor.map(
+                _parse_page, uncached_pages, chunksize=chunksize
+            )
+
+            for dictionary_page, parsed_page in zip(dictionary_pages, cached_pages):
+                if parsed_page is None:
+                    parsed_page = next(parsed_pages)
+                    self._set_cached_page(dictionary_page, parsed_page)
+
+                yield dictionary_page, parsed_page
+
+    def _iter_indexed_parsed_pages(
+        self,
+    ) -> Iterator[tuple[DictionaryPage, ParsedPage]]:
+        for index, dictionary_page in enumerate(self._get_page_index()):
+            pages = self.get_pages(index)
+
+            with instrumentation.page(dictionary_page.name):
+                parsed_page = _get_parsed_page(pages)
+
+            yield dictionary_page, parsed_page
+
+    def _iter_parsed_pages(self) -> Iterator[tuple[DictionaryPage, ParsedPage]]:
+        if self._workers <= 1 and not self._stream and self._cache is None:
+            # Pages stay available for later access, eg. debugging single pages.
+            yield from self._iter_indexed_parsed_pages()
+        elif self._workers <= 1:
+            yield from self._iter_serial_parsed_pages()
+        elif self._stream:
+            yield from self._iter_parallel_stream_parsed_pages()
+        else:
+            yield from self._iter_parallel_parsed_pages()
+
+        if self._cache is not None and self._cache.autosave:
+            self._cache.save()
+
+    def _iter_unmerged_entries(self) -> Iterator[Entry]:
+        for dictionary_page, parsed_page in self._iter_parsed_pages():
+            self._fired_search_replaces[dictionary_page.name] = (
+                parsed_page.fired_search_replaces
+            )
+
+            yield from _trim_boundary_entries(dictionary_page, parsed_page.entries)
+
+    def iter_entries(self) -> Iterator[Entry]:
+        if self._entries is not None:
+            yield from self._entries
+            return
+
+        if self._stream:
+            # Otherwise consumed stream would look like an empty dictionary.
+            if self._is_streamed:
+                raise ValueError("Pages of streamed dictionary were already iterated")
+
+            self._is_streamed = True
+
+        for entry in _merge_partial_entries(self._iter_unmerged_entries()):
             if entry.status != EntryStatus.VALID:
                 print("Unexpected entry!")
                 print(entry.headword)
                 print(entry.definitions)
                 print(entry.status)
 
-        return filtered_entries
+            yield entry
+
+    def get_fired_search_replaces(self) -> dict[str, Counter[str]]:
+        """
+        Search strings of known OCR errors replaced in each page, and their
+        counts. Filled in as entries are iterated.
+        """
+        return self._fired_search_replaces
+
+    def get_entries(self) -> list[Entry]:
+        """
+        Entries are parsed once, later calls return the same list.
+        """
+        if self._entries is None:
+            self._entries = list(self.iter_entries())
+
+        return self._entries
@@ -1,5 +1,9 @@
+import sys
 from enum import Enum
-from typing import Final, NamedTuple, Sequence
+from typing import Final, Sequence
+
+from src.parser import instrumentation
+from src.parser.senses import Sense, parse_senses
 
 # Incorrectly OCR'd headwords and their correct spellings.
 KNOWN_HEADWORD_TYPOS_TO_CORRECT_VERSIONS: Final[dict[str, str]] = {
@@ -60,36 +64,105 @@ EXCEPTIONS_TO_COMMA_RULE: Final[list[str]] = ["X"]
 class EntryStatus(Enum):
     VALID = ("valid",)
     PART_OF_PREVIOUS_ENTRY = "part-of-previous-entry"
-    DELETED = "deleted"
 
 
-class Entry(NamedTuple):
+class Entry:
+    """
+    Entries are kept compact, as whole dictionary is held in memory:
+    definitions are stored UTF-8 encoded (em dashes would otherwise double
+    the size of most definitions) and headwords are interned.
+    Definitions are split to senses once, and stored as offsets.
+    Structured senses are parsed on first use, and kept too, but not
+    pickled: cached pages hold definitions and offsets only.
+    """
+
+    __slots__ = ("headword", "status", "_definitions", "_sense_offsets", "_senses")
+
     headword: str
-    definitions: str
     status: EntryStatus
+    _definitions: bytes
+    # Start & end of each sense in definitions. Empty when not split,
+    # None until first needed.
+    _sense_offsets: tuple[int, ...] | None
+    _senses: list[Sense] | None
+
+    def __init__(self, headword: str, definitions: str, status: EntryStatus) -> None:
+        self.headword = sys.intern(headword)
+        self.status = status
+        self._definitions = definitions.encode()
+        self._sense_offsets = None
+        self._senses = None
+
+    @classmethod
+    def _from_encoded(
+        cls, headword: str, definitions: bytes, status: EntryStatus
+    ) -> "Entry":
+        entry = cls.__new__(cls)
+        entry.headword = headword
+        entry.status = status
+        entry._definitions = definitions
+        entry._sense_offsets = None
+        entry._senses = None
+
+        return entry
+
+    def __getstate__(
+        self,
+    ) -> tuple[str, EntryStatus, bytes, tuple[int, ...] | None]:
+        return self.headword, self.status, self._definitions, self._sense_offsets
+
+    def __setstate__(
+        self, state: tuple[str, EntryStatus, bytes, tuple[int, ...] | None]
+    ) -> None:
+        self.headword, self.status, self._definitions, self._sense_offsets = state
+        self._senses = None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Entry):
+            return NotImplemented
+
+        return (
+            self.headword == other.headword
+            and self._definitions == other._definitions
+            and self.status == other.status
+        )
+
+    def __hash__(self) -> int:
+        # Status is left out, hashing enums is slow.
+        return hash((self.headword, self._definitions))
+
+    def __repr__(self) -> str:
+        return (
+            f"Entry(headword={self.headword!r}, "
+            f"definitions={self.definitions!r}, status={self.status})"
+        )
 
     @property
-    def definitions_list(self) -> list[str]:
+    def definitions(self) -> str:
+        return self._definitions.decode()
+
+    @staticmethod
+    def _split_definitions(definitions: str) -> list[str]:
         entry_starts = ["1)", "2)", "3)", "4)"]
 
         # We only want to process "intact" looking definitions.
-        if "1) " not in self.definitions:
-            return [self.definitions]
+        if "1) " not in definitions:
+            return [definitions]
 
         lines: list[str] = []
-        line = ""
+        line_words: list[str] = []
 
-        words = self.definitions.split(" ")
+        words = definitions.split(" ")
 
         # Walk through words, parsing new lines with new numbered indexes.
         for word in words:
             if word in entry_starts:
-                lines.append(line.strip())
-                line = ""
+                lines.append(" ".join(line_words).strip())
+                line_words = []
 
-            line = f"{line} {word}"
+            line_words.append(word)
 
-        lines.append(line.strip())
+        lines.append(" ".join(line_words).strip())
 
         # Sanity: we want each line to be properly numbered with no jumps.
         expected_number = 1
@@ -100,35 +173,102 @@ class Entry(NamedTuple):
             first = line[0]
             if first.isnumeric():
                 if int(first) != expected_number:
-                    return [self.definitions]
+                    return [definitions]
 
                 expected_number += 1
 
         return lines
 
-    def to_json(self) -> dict[str, str | list[str]]:
-        return {
+    @staticmethod
+    def _get_sense_offsets(definitions: str, senses: list[str]) -> tuple[int, ...]:
+        if senses == [definitions]:
+            return ()
+
+        offsets: list[int] = []
+        position = 0
+        byte_position = 0
+
+        # Senses are stripped parts of definitions, in order.
+        for sense in senses:
+            start = definitions.index(sense, position)
+            byte_start = byte_position + len(definitions[position:start].encode())
+            byte_end = byte_start + len(sense.encode())
+
+            offsets.extend((byte_start, byte_end))
+
+            position = start + len(sense)
+            byte_position = byte_end
+
+        return tuple(offsets)
+
+    @property
+    @instrumentation.timed("entry.definitions_list")
+    def definitions_list(self) -> list[str]:
+        if self._sense_offsets is None:
+            definitions = self.definitions
+            senses = self._split_definitions(definitions)
+            self._sense_offsets = self._get_sense_offsets(definitions, senses)
+
+            return senses
+
+        if not self._sense_offsets:
+            return [self.definitions]
+
+        offsets = iter(self._sense_offsets)
+
+        return [
+            self._definitions[start:end].decode()
+            for start, end in zip(offsets, offsets)
+        ]
+
+    @property
+    def senses(self) -> list[Sense]:
+        """
+        Definitions as structured senses, with sub-senses & sources.
+        """
+        if self._senses is None:
+            self._senses = self._parse_senses()
+
+        return self._senses
+
+    @instrumentation.timed("entry.senses")
+    def _parse_senses(self) -> list[Sense]:
+        return parse_senses(self.definitions)
+
+    def to_json(
+        self, with_senses: bool = False
+    ) -> dict[str, str | list[str] | list[dict]]:
+        json_entry: dict[str, str | list[str] | list[dict]] = {
             "headword": self.headword,
             "definitions": self.definitions_list,
         }
 
+        if with_senses:
+            json_entry["senses"] = [sense.to_json() for sense in self.senses]
+
+        return json_entry
+
     @staticmethod
-    def combine_entries(first_entry: "Entry", second_entry: "Entry") -> "Entry":
+    @instrumentation.timed("dictionary.combine_entries")
+    def combine_entries(first_entry: "Entry", *partial_entries: "Entry") -> "Entry":
+        """
+        Entry with definitions of partial entries appended, joined at once.
+        Partial entries' headwords were really first words of their definitions.
+        """
         assert first_entry.status != EntryStatus.PART_OF_PREVIOUS_ENTRY
-        assert second_entry.status == EntryStatus.PART_OF_PREVIOUS_ENTRY
 
-        return Entry(
+        parts = [first_entry._definitions]
+
+        for partial_entry in partial_entries:
+            assert partial_entry.status == EntryStatus.PART_OF_PREVIOUS_ENTRY
+
+            parts.append(partial_entry.headword.encode())
+            parts.append(partial_entry._definitions)
+
+        return Entry._from_encoded(
             headword=first_entry.headword,
             status=first_entry.status,
-            definitions=f"{first_entry.definitions} {second_entry.headword} {second_entry.definitions}",
-        )
-
-    @staticmethod
-    def mark_for_deletion(entry: "Entry") -> "Entry":
-        return Entry(
-            headword=entry.headword,
-            status=EntryStatus.DELETED,
-            definitions=entry.definitions,
+            definitions=b" ".join(parts),
         )
 
     @staticmethod
@@ -204,6 +344,7 @@ class Entry(NamedTuple):
         )
 
     @classmethod
+    @instrumentation.timed("entry.from_raw_entry")
     def from_raw_entry(
         cls,
         raw_entry: str,
@@ -0,0 +1,151 @@
+"""
+Opt-in timing of parsing stages and pages.
+
+Stages are timed exclusively: time spent in a nested stage (eg. entries
+parsed inside Page.get_entries) is only counted for the nested stage.
+When disabled, timed functions cost one flag check per call.
+Measurements are kept per process.
+"""
+
+import statistics
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Iterable, Iterator, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_enabled = False
+
+_stage_seconds: defaultdict[str, float] = defaultdict(float)
+_stage_calls: Counter[str] = Counter()
+_page_seconds: defaultdict[str, float] = defaultdict(float)
+
+# Time spent in nested stages, per running stage.
+_child_seconds: list[float] = []
+_current_page: str | None = None
+
+
+def enable() -> None:
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    _stage_seconds.clear()
+    _stage_calls.clear()
+    _page_seconds.clear()
+
+
+def timed(stage: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    def decorator(function: Callable[P, R]) -> Callable[P, R]:
+        @wraps(function)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not _enabled:
+                return function(*args, **kwargs)
+
+            _child_seconds.append(0.0)
+            start = time.perf_counter()
+
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                nested = _child_seconds.pop()
+
+                _stage_seconds[stage] += elapsed - nested
+                _stage_calls[stage] += 1
+
+                if _child_seconds:
+                    _child_seconds[-1] += elapsed
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def page(name: str) -> Iterator[None]:
+    """
+    Attribute time spent in block to page of given name.
+    """
+    global _current_page
+
+    if not _enabled or _current_page is not None:
+        # Nested blocks of same page are already measured.
+        yield
+        return
+
+    _current_page = name
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        _page_seconds[name] += time.perf_counter() - start
+        _current_page = None
+
+
+def get_stage_seconds() -> dict[str, float]:
+    return dict(_stage_seconds)
+
+
+def get_stage_calls() -> dict[str, int]:
+    return dict(_stage_calls)
+
+
+def get_slowest_pages(amount: int) -> list[tuple[str, float]]:
+    pages = sorted(_page_seconds.items(), key=lambda item: item[1], reverse=True)
+    return pages[:amount]
+
+
+def get_latency_percentiles(nanoseconds: Iterable[int]) -> dict[str, float]:
+    """
+    Median, 90th & 99th percentile of latencies, in microseconds.
+    """
+    microseconds = [latency / 1_000 for latency in nanoseconds]
+
+    # Quantiles need at least two samples.
+    quantiles = (
+        statistics.quantiles(microseconds, n=100, method="inclusive")
+        if len(microseconds) > 1
+        else microseconds * 99
+    )
+
+    return {"p50_us": quantiles[49], "p90_us": quantiles[89], "p99_us": quantiles[98]}
+
+
+def get_report(slowest_pages: int = 10) -> str:
+    total_seconds = sum(_stage_seconds.values()) or 1.0
+
+    lines = [f"{'stage':<30} {'calls':>8} {'seconds':>10} {'share':>7} {'mean µs':>10}"]
+
+    for stage, seconds in sorted(
+        _stage_seconds.items(), key=lambda item: item[1], reverse=True
+    ):
+        calls = _stage_calls[stage]
+        lines.append(
+            f"{stage:<30} {calls:>8} {seconds:>10.3f} "
+            f"{seconds / total_seconds:>7.1%} {seconds / calls * 1_000_000:>10.1f}"
+        )
+
+    lines.append("")
+    lines.append(f"Slowest {slowest_pages} pages:")
+
+    for name, seconds in get_slowest_pages(slowest_pages):
+        # Some filenames contain linebreaks.
+        printable_name = name.replace("\n", "\\n")
+        lines.append(f"  {seconds * 1000:>8.1f} ms  {printable_name}")
+
+    return "\n".join(lines)
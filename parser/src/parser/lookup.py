@@ -0,0 +1,64 @@
+"""
+In-memory index over built dictionary, for exact & prefix lookups of
+headwords. Headwords are matched case-insensitively.
+"""
+
+import bisect
+import json
+from typing import Final, Iterable
+
+EntryJson = dict[str, str | list[str]]
+
+default_prefix_limit: Final[int] = 50
+
+
+class HeadwordIndex:
+    _entries: list[EntryJson]
+    # Casefolded headword => indexes of its entries, in dictionary order.
+    _exact: dict[str, list[int]]
+    _sorted_headwords: list[str]
+
+    def __init__(self, entries: Iterable[EntryJson]) -> None:
+        self._entries = list(entries)
+        self._exact = {}
+
+        for index, entry in enumerate(self._entries):
+            headword = str(entry["headword"]).casefold()
+            self._exact.setdefault(headword, []).append(index)
+
+        self._sorted_headwords = sorted(self._exact)
+
+    @classmethod
+    def from_json_file(cls, file_path: str) -> "HeadwordIndex":
+        with open(file_path, "r") as json_file:
+            return cls(json.load(json_file))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, headword: str) -> list[EntryJson]:
+        return [
+            self._entries[index] for index in self._exact.get(headword.casefold(), [])
+        ]
+
+    def lookup_prefix(
+        self, prefix: str, limit: int = default_prefix_limit
+    ) -> list[EntryJson]:
+        """
+        Entries of headwords starting with prefix, in alphabetical order of
+        headwords, at most limit of them.
+        """
+        prefix = prefix.casefold()
+        entries: list[EntryJson] = []
+        position = bisect.bisect_left(self._sorted_headwords, prefix)
+
+        while position < len(self._sorted_headwords) and len(entries) < limit:
+            headword = self._sorted_headwords[position]
+
+            if not headword.startswith(prefix):
+                break
+
+            entries.extend(self.lookup(headword)[: limit - len(entries)])
+            position += 1
+
+        return entries
@@ -0,0 +1,167 @@
+"""
+Manifest of page files: number, size, content hash & headword letters of
+each page, so that pages of selective builds can be picked without opening
+the rest. Manifest is cached, pages are only rehashed when their size or
+modification time changed. Letters come from page rules, so they are
+resolved again on each load.
+"""
+
+import hashlib
+import json
+import os
+from typing import Collection, Final, NamedTuple
+
+from src.parser import reader
+from src.parser.dictionary import DictionaryPage
+from src.parser.page_meta import PageMeta
+
+_manifest_version: Final[int] = 1
+
+
+class ManifestPage(NamedTuple):
+    number: int
+    name: str
+    size: int
+    modified_ns: int
+    content_hash: str
+    letters: list[str]
+
+
+def _get_content_hash(path: str) -> str:
+    with open(path, "rb") as infile:
+        return hashlib.sha256(infile.read()).hexdigest()
+
+
+class Manifest:
+    _folder: str
+    _file_path: str
+    _pages: list[ManifestPage]
+
+    def __init__(
+        self,
+        folder: str = reader.input_folder,
+        file_path: str = "resources/cache/manifest.json",
+    ) -> None:
+        self._folder = folder
+        self._file_path = file_path
+        self._pages = self._refresh(self._load())
+
+    def _load(self) -> dict[str, ManifestPage]:
+        try:
+            with open(self._file_path, "r") as infile:
+                manifest = json.load(infile)
+        except (OSError, ValueError):
+            return {}
+
+        if manifest.get("version") != _manifest_version:
+            return {}
+
+        return {page[1]: ManifestPage(*page) for page in manifest["pages"]}
+
+    def _refresh(self, cached_pages: dict[str, ManifestPage]) -> list[ManifestPage]:
+        pages: list[ManifestPage] = []
+
+        for name in reader.get_ordered_files(self._folder):
+            stat = os.stat(os.path.join(self._folder, name))
+            page = cached_pages.get(name)
+
+            if (
+                page is None
+                or page.size != stat.st_size
+                or page.modified_ns != stat.st_mtime_ns
+            ):
+                page = ManifestPage(
+                    number=int(name.split("-")[0]),
+                    name=name,
+                    size=stat.st_size,
+                    modified_ns=stat.st_mtime_ns,
+                    content_hash=_get_content_hash(os.path.join(self._folder, name)),
+                    letters=PageMeta.get_letters_for_page(name),
+                )
+            else:
+                # Rules of letters may have changed since page was listed.
+                page = page._replace(letters=PageMeta.get_letters_for_page(name))
+
+            pages.append(page)
+
+        if pages != list(cached_pages.values()):
+            self._save(pages)
+
+        return pages
+
+    def _save(self, pages: list[ManifestPage]) -> None:
+        folder = os.path.dirname(self._file_path)
+
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
+
+        with open(self._file_path, "w") as outfile:
+            json.dump(
+                {"version": _manifest_version, "pages": pages},
+                outfile,
+                ensure_ascii=False,
+            )
+
+    def get_pages(self) -> list[ManifestPage]:
+        return self._pages
+
+    def _get_letter_matches(self, letters: Collection[str]) -> list[bool]:
+        matches = [
+            any(letter in letters for letter in page.letters) for page in self._pages
+        ]
+
+        # Odd pages of other letters in the middle of a letter, eg. "(Hellig)
+        # Korsaften" in K, are parsed as part of it in full builds too.
+        return [
+            match
+            or (
+                0 < index < len(matches) - 1
+                and matches[index - 1]
+                and matches[index + 1]
+            )
+            for index, match in enumerate(matches)
+        ]
+
+    def _read_page(self, page: ManifestPage, **boundary: bool) -> DictionaryPage:
+        return DictionaryPage(
+            name=page.name,
+            lines=reader.read_file(os.path.join(self._folder, page.name)),
+            **boundary,
+        )
+
+    def select(
+        self,
+        page_numbers: Collection[int] | None = None,
+        letters: Collection[str] | None = None,
+    ) -> list[DictionaryPage]:
+        """
+        Read pages matching both page numbers & letters, when given.
+        Page following each run of selected pages is read too, for entries
+        continuing from the run.
+        """
+        letter_matches = (
+            [True] * len(self._pages)
+            if letters is None
+            else self._get_letter_matches(letters)
+        )
+
+        selected = [
+            (page_numbers is None or page.number in page_numbers) and letter_match
+            for page, letter_match in zip(self._pages, letter_matches)
+        ]
+
+        dictionary_pages: list[DictionaryPage] = []
+
+        for index, page in enumerate(self._pages):
+            follows_selected = index > 0 and selected[index - 1]
+
+            if selected[index]:
+                dictionary_pages.append(
+                    self._read_page(
+                        page, skip_continuation=index > 0 and not follows_selected
+                    )
+                )
+            elif follows_selected:
+                dictionary_pages.append(self._read_page(page, continuation_only=True))
+
+        return dictionary_pages
@@ -0,0 +1,95 @@
+"""
+Pieces shared by binary formats: temporary heap that writers fill as entries
+come in, and read-only memory-mapped file that readers look values up from.
+
+Formats start with a header of magic (4 bytes) & version (u32), followed by
+counts of the format, all little-endian.
+"""
+
+import mmap
+import shutil
+import struct
+import tempfile
+from types import TracebackType
+from typing import IO, TypeVar
+
+T = TypeVar("T", bound="MappedFile")
+
+
+class TemporaryHeap:
+    """
+    Bytes written to temporary file, so that only their offsets need to be
+    kept in memory until heap is copied after the table of its format.
+    """
+
+    _file: IO[bytes]
+    _size: int
+
+    def __init__(self) -> None:
+        self._file = tempfile.TemporaryFile()
+        self._size = 0
+
+    def write(self, data: bytes) -> int:
+        """
+        Offset of written data from start of heap.
+        """
+        offset = self._size
+        self._file.write(data)
+        self._size += len(data)
+        return offset
+
+    def copy_to(self, output_file: IO[bytes]) -> None:
+        """
+        Copy heap to output file and close it.
+        """
+        self._file.seek(0)
+        shutil.copyfileobj(self._file, output_file)
+        self._file.close()
+
+
+class MappedFile:
+    """
+    Read-only memory-mapped file, so lookups only touch the pages they need
+    and processes share the page cache.
+    """
+
+    _file: IO[bytes]
+    _mmap: mmap.mmap
+
+    def _map(
+        self,
+        file_path: str,
+        header: struct.Struct,
+        magic: bytes,
+        version: int,
+        format_name: str,
+    ) -> list[int]:
+        """
+        Map file and check its magic & version, counts of header are returned.
+        Raises ValueError for files of other formats or versions.
+        """
+        self._file = open(file_path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        file_magic, file_version, *counts = header.unpack_from(self._mmap, 0)
+
+        if file_magic != magic or file_version != version:
+            self.close()
+            raise ValueError(f"Not a {format_name} of version {version}")
+
+        return counts
+
+    def __enter__(self: T) -> T:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
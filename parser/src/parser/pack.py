@@ -0,0 +1,115 @@
+"""
+Page pack format, all integers little-endian:
+
+    header:  magic (4 bytes), version (u32), page count (u32)
+    table:   page count * (name offset, name length,
+             text offset, text length), all u32,
+             in page number order
+    blob:    UTF-8 page names & texts
+
+Offsets in table are relative to start of blob. Names are stored as is,
+some of them contain linebreaks.
+"""
+
+import struct
+from typing import IO, Final, Iterator
+
+from src.parser import instrumentation
+from src.parser.mapped_file import MappedFile, TemporaryHeap
+
+MAGIC: Final[bytes] = b"ODTP"
+VERSION: Final[int] = 1
+
+_header: Final[struct.Struct] = struct.Struct("<4sII")
+_table_row: Final[struct.Struct] = struct.Struct("<IIII")
+
+
+def _split_lines(text: str) -> list[str]:
+    # Same lines as readlines() of the page file would give.
+    parts = text.split("\n")
+    lines = [f"{part}\n" for part in parts[:-1]]
+
+    if parts[-1]:
+        lines.append(parts[-1])
+
+    return lines
+
+
+class PagePackWriter:
+    """
+    Writes pages to pack in the order they are given. Texts are written to
+    temporary blob as pages come in, only offsets are kept in memory.
+    """
+
+    _pack_file: IO[bytes]
+    _blob: TemporaryHeap
+    _rows: list[tuple[int, int, int, int]]
+
+    def __init__(self, pack_file: IO[bytes]) -> None:
+        self._pack_file = pack_file
+        self._blob = TemporaryHeap()
+        self._rows = []
+
+    def write(self, name: str, text: str) -> None:
+        encoded_name = name.encode()
+        encoded_text = text.encode()
+
+        self._rows.append(
+            (
+                self._blob.write(encoded_name),
+                len(encoded_name),
+                self._blob.write(encoded_text),
+                len(encoded_text),
+            )
+        )
+
+    def finish(self) -> None:
+        self._pack_file.write(_header.pack(MAGIC, VERSION, len(self._rows)))
+
+        for row in self._rows:
+            self._pack_file.write(_table_row.pack(*row))
+
+        self._blob.copy_to(self._pack_file)
+
+
+class PagePack(MappedFile):
+    """
+    Read-only view to page pack. File is memory-mapped, pages are decoded
+    only when iterated to.
+    """
+
+    _count: int
+    _blob_start: int
+
+    def __init__(self, file_path: str) -> None:
+        (self._count,) = self._map(file_path, _header, MAGIC, VERSION, "page pack")
+        self._blob_start = _header.size + self._count * _table_row.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _get_string(self, offset: int, length: int) -> str:
+        start = self._blob_start + offset
+        return self._mmap[start : start + length].decode()  # noqa: E203
+
+    def get_name(self, index: int) -> str:
+        name_offset, name_length, _, _ = _table_row.unpack_from(
+            self._mmap, _header.size + index * _table_row.size
+        )
+        return self._get_string(name_offset, name_length)
+
+    @instrumentation.timed("reader.read_pack_page")
+    def get_lines(self, index: int) -> list[str]:
+        _, _, text_offset, text_length = _table_row.unpack_from(
+            self._mmap, _header.size + index * _table_row.size
+        )
+        return _split_lines(self._get_string(text_offset, text_length))
+
+    def iter_pages(self) -> Iterator[tuple[str, list[str]]]:
+        for index in range(self._count):
+            name = self.get_name(index)
+
+            with instrumentation.page(name):
+                lines = self.get_lines(index)
+
+            yield name, lines
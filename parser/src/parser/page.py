@@ -1,41 +1,72 @@
-import re
-from typing import Final
+from collections import Counter
+from typing import Final, NamedTuple
 
+from src.parser import instrumentation, search_replace, segmenter
 from src.parser.entry import Entry
 from src.parser.page_meta import PageMeta
 
 METALINE_ENTRY_SEPARATOR: Final[str] = "—"
 
 
+class ParsedPage(NamedTuple):
+    """
+    Results of parsing a page file, as handed back from worker processes
+    and kept in page cache.
+    """
+
+    entries: list[Entry]
+    # Search strings of known OCR errors replaced in page, and their counts.
+    fired_search_replaces: Counter[str]
+
+
 class Page:
+    """
+    Proofreading & entry parsing run on first access, and are kept for later ones.
+    """
+
     _page_number: int | None = None
     _letters_in_page: list[str] | None = None
     _raw_content: list[str]
+    _content: list[str] | None = None
+    _fired_search_replaces: Counter[str]
+    _entries: list[Entry] | None = None
 
     def __init__(self, lines: list[str], name: str) -> None:
         # While pages have irregular meta lines, column parsing should've offsetted it already.
         self.meta = lines[0]
         self._raw_content = lines[1:]
         self.name = name
-        self.content = self._proofread_lines(lines[1:])
+        self.plan = PageMeta.get_page_plan(name)
+
+    @property
+    def content(self) -> list[str]:
+        if self._content is None:
+            self._content = self._proofread_lines(self._raw_content)
 
+        return self._content
+
+    @instrumentation.timed("page.proofread_lines")
     def _proofread_lines(self, raw_content: list[str]) -> list[str]:
         # For known OCR erors in line, search/replace them here
         # based on mapping of page name => known errors.
-        content = raw_content
-
-        if search_replaces := PageMeta.get_known_search_replaces(self.name):
-            for search, replace in search_replaces:
-                for idx, line in enumerate(content):
-                    content[idx] = line.replace(search, replace)
+        search_replacer = search_replace.get_plan_search_replacer(self.plan)
+        content, self._fired_search_replaces = search_replacer.replace_lines(
+            raw_content
+        )
 
         return content
 
+    def get_fired_search_replaces(self) -> Counter[str]:
+        """
+        Search strings of known OCR errors replaced in page, and their counts.
+        """
+        if self._content is None:
+            self._content = self._proofread_lines(self._raw_content)
+
+        return self._fired_search_replaces
+
     def get_separators_for(self, letter: str) -> list[str]:
-        return [
-            rf"(\b{letter}[\w\S]+\b,)",  # Capital letter and words ends in comma.
-            rf"(\b{letter}[\w\S]+\b-)",  # Capital letter and words ends in dash, ie. linebreak.
-        ]
+        return segmenter.get_separators_for(letter)
 
     def get_entry_separators(self) -> set[str]:
         return {
@@ -67,67 +98,30 @@ class Page:
         However: it can be split between end of first & start of second letter.
         """
         if not self._letters_in_page:
-            self._letters_in_page = PageMeta.get_letters_for_page(self.name)
+            self._letters_in_page = list(self.plan.letters)
 
         return self._letters_in_page
 
     def set_letters_in_page(self, letters: list[str]) -> None:
         self._letters_in_page = letters
+        # Entries are parsed by letters of page.
+        self._entries = None
 
     def get_entries(self) -> list[Entry]:
-        def _line_is_entry(line: str) -> bool:
-            # Break into words, omitting spacing the beginning.
-            parts = line.lstrip().split(" ")
-
-            # Some exotic parts do not respect length, probably linebreakish thing.
-            # If it breaks, its not an entry.
-            try:
-                parts[0][-1]
-            except IndexError:
-                return False
-
-            # Compare first letter to expected/allowed letters of page.
-            if (
-                len(parts) == 1
-                and not parts[0][0].upper() in self.get_letters_in_page()
-            ):
-                return False
-
-            # Check if first words ends like entries should.
-            return len(parts) == 1 and parts[0][-1] in [",", "-"]
+        if self._entries is None:
+            self._entries = self._parse_entries()
 
-        raw_entries = ["\n".join(self.content)]
+        return self._entries
 
+    @instrumentation.timed("page.get_entries")
+    def _parse_entries(self) -> list[Entry]:
         letters = self.get_letters_in_page()
 
         assert (
             len(letters) == 1
         ), "Should only have one letter per page when parsing entries!"
 
-        for letter in self.get_letters_in_page():
-            separators_regex = "|".join(self.get_separators_for(letter))
-
-            # Unsplit content should always be in the last entry.
-            line_entries_for_letter = re.split(separators_regex, raw_entries[-1])
-
-            entries_for_letter = []
-
-            for idx, line in enumerate(line_entries_for_letter):
-                if line:
-                    if idx == 0:
-                        entries_for_letter.append(line)
-                        continue
-
-                    if _line_is_entry(line):
-                        entries_for_letter.append(line)
-                    else:
-                        # Line may contain linebreaks, which are not required at the beginning.
-                        line_without_breaks = line.lstrip("\\n")
-                        entries_for_letter[
-                            -1
-                        ] = f"{entries_for_letter[-1]} {line_without_breaks}"
-
-            raw_entries = raw_entries[0:-2] + entries_for_letter
+        raw_entries = segmenter.segment_entries("\n".join(self.content), letters[0])
 
         # Format string entries to structures.
         entries = [
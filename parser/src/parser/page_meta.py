@@ -1,4 +1,5 @@
-from typing import Final
+from functools import cache
+from typing import Final, NamedTuple
 
 PAGES_TO_IRREGULAR_META_LINE_INDEXES: Final[dict[str, int]] = {
     "71-arbejdelse.txt": 1,
@@ -100,6 +101,10 @@ KNOWN_OCR_ERROR_SEARCH_REPLACES: Final[dict[str, list[tuple[str, str]]]] = {
     "2172-øxentorv.txt": [("Fadre", "Padre"), ("Padse.", "Padse,")],
 }
 
+# Known OCR errors that can be fixed in any page.
+# Page specific search/replaces override these.
+GLOBAL_OCR_ERROR_SEARCH_REPLACES: Final[list[tuple[str, str]]] = []
+
 PAGES_TO_CUSTOM_COLUMN_BREAKS_IN_LINES: Final[dict[str, list[tuple[str, int]]]] = {
     # Page -> problematic line -> nth character to break from.
     "1783-midsunds.txt": [
@@ -108,6 +113,21 @@ PAGES_TO_CUSTOM_COLUMN_BREAKS_IN_LINES: Final[dict[str, list[tuple[str, int]]]]
 }
 
 
+class PagePlan(NamedTuple):
+    """
+    Rules of one page, resolved from the tables above once per page name.
+    """
+
+    name: str
+    meta_line_index: int
+    # Line index to split pages with two letters from.
+    split_point: int | None
+    letters: tuple[str, ...]
+    # Global rules first, page specific ones override them.
+    search_replaces: tuple[tuple[str, str], ...]
+    column_breaks: tuple[tuple[str, int], ...]
+
+
 class PageMeta:
     @staticmethod
     def get_meta_line_index(name: str) -> int:
@@ -129,6 +149,30 @@ class PageMeta:
     def get_known_search_replaces(page: str) -> list[tuple[str, str]]:
         return KNOWN_OCR_ERROR_SEARCH_REPLACES.get(page, [])
 
+    @staticmethod
+    def get_global_search_replaces() -> list[tuple[str, str]]:
+        return GLOBAL_OCR_ERROR_SEARCH_REPLACES
+
     @staticmethod
     def get_custom_column_breaks(page: str) -> list[tuple[str, int]]:
         return PAGES_TO_CUSTOM_COLUMN_BREAKS_IN_LINES.get(page, [])
+
+    @staticmethod
+    @cache
+    def get_page_plan(name: str) -> PagePlan:
+        return PagePlan(
+            name=name,
+            meta_line_index=PageMeta.get_meta_line_index(name),
+            split_point=LETTER_SPLIT_MAPPING.get(name),
+            # Names not like "<number>-<first headword>.txt" have no known letters.
+            letters=(
+                tuple(PageMeta.get_letters_for_page(name))
+                if name.partition("-")[2]
+                else ()
+            ),
+            search_replaces=tuple(
+                PageMeta.get_global_search_replaces()
+                + PageMeta.get_known_search_replaces(name)
+            ),
+            column_breaks=tuple(PageMeta.get_custom_column_breaks(name)),
+        )
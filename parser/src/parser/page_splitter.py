@@ -6,14 +6,14 @@ from src.parser.page_meta import PageMeta
 class PageSplitter:
     @staticmethod
     def is_split_page(filename: str) -> bool:
-        return filename in PageMeta.get_pages_splits()
+        return PageMeta.get_page_plan(filename).split_point is not None
 
     @classmethod
     def split_page(cls, filename: str, lines: list[str]) -> tuple[Page, Page]:
-        if not cls.is_split_page(filename):
-            raise ValueError("Provided page that should not be split")
+        split_point = PageMeta.get_page_plan(filename).split_point
 
-        split_point = PageMeta.get_pages_splits()[filename]
+        if split_point is None:
+            raise ValueError("Provided page that should not be split")
 
         # Split by the split point, but append meta line to the second part too.
         combined_column_1_lines = parse_column(page=lines[0:split_point], name=filename)
@@ -1,25 +1,74 @@
 import os
-from typing import Final
+from typing import Final, Iterator
+
+from src.parser import instrumentation
+from src.parser.pack import PagePack, PagePackWriter
 
 input_folder: Final[str] = "resources/text"
 output_folder: Final[str] = "resources/parsed"
+pack_file: Final[str] = "resources/text.pack"
+
+
+def get_ordered_files(folder: str) -> list[str]:
+    unordered_files = [f for f in os.listdir(folder) if f.endswith(".txt")]
+    return sorted(unordered_files, key=lambda x: int(x.split("-")[0]))
+
 
+@instrumentation.timed("reader.read_file")
+def read_file(input_path: str) -> list[str]:
+    with open(input_path, "r") as infile:
+        return infile.readlines()
 
-def read_files() -> list[tuple[str, list[str]]]:
+
+def _ensure_output_folder() -> None:
     if not os.path.exists(output_folder):
         os.makedirs(output_folder)
 
-    pages: list[tuple[str, list[str]]] = []
 
-    unordered_files = [f for f in os.listdir(input_folder) if f.endswith(".txt")]
-    files = sorted(unordered_files, key=lambda x: int(x.split("-")[0]))
+def iter_files(folder: str = input_folder) -> Iterator[tuple[str, list[str]]]:
+    """
+    Lazy version of read_files: only one page is read in memory at a time.
+    """
+    _ensure_output_folder()
 
-    for file in files:
+    for file in get_ordered_files(folder):
         filename = file.split("/")[-1]
-        input_path = os.path.join(input_folder, file)
+        input_path = os.path.join(folder, file)
+
+        with instrumentation.page(filename):
+            lines = read_file(input_path)
+
+        yield filename, lines
+
+
+def read_files(folder: str = input_folder) -> list[tuple[str, list[str]]]:
+    return list(iter_files(folder))
+
+
+def pack_files(folder: str = input_folder, file_path: str = pack_file) -> int:
+    """
+    Bundle page files of folder to single pack file, in page order.
+    Returns amount of pages packed.
+    """
+    files = get_ordered_files(folder)
+
+    with open(file_path, "wb") as outfile:
+        pack_writer = PagePackWriter(outfile)
+
+        for file in files:
+            with open(os.path.join(folder, file), "r") as infile:
+                pack_writer.write(file, infile.read())
+
+        pack_writer.finish()
+
+    return len(files)
+
 
-        with open(input_path, "r") as infile:
-            lines = infile.readlines()
-            pages.append((filename, lines))
+def iter_pack(file_path: str = pack_file) -> Iterator[tuple[str, list[str]]]:
+    """
+    Same pages as iter_files, read from memory-mapped pack file.
+    """
+    _ensure_output_folder()
 
-    return pages
+    with PagePack(file_path) as pack:
+        yield from pack.iter_pages()
@@ -0,0 +1,125 @@
+import re
+from collections import Counter
+from functools import cache
+from typing import Final
+
+from src.parser.page_meta import PageMeta, PagePlan
+
+_Trie = dict[str, "_Trie"]
+
+# Marks end of a search string in trie.
+_END: Final[str] = ""
+
+
+def _trie_to_pattern(trie: _Trie) -> str:
+    branches = [
+        re.escape(char) + _trie_to_pattern(child)
+        for char, child in sorted(trie.items())
+        if char != _END
+    ]
+
+    if not branches:
+        return ""
+
+    pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+    # Greedy optional: prefer longer search strings sharing the same start.
+    return f"(?:{pattern})?" if _END in trie else pattern
+
+
+def _compile_searches(searches: list[str]) -> re.Pattern[str]:
+    trie: _Trie = {}
+
+    for search in searches:
+        node = trie
+        for char in search:
+            node = node.setdefault(char, {})
+        node[_END] = {}
+
+    return re.compile(_trie_to_pattern(trie))
+
+
+class SearchReplacer:
+    """
+    Applies many search/replace rules to a line in one scan.
+
+    Search strings are compiled to a single regex shaped like a trie, so
+    each position is matched against shared prefixes only once, no matter
+    how many rules there are. Leftmost, then longest search wins.
+    """
+
+    _replaces: dict[str, str]
+    _pattern: re.Pattern[str] | None
+
+    def __init__(self, search_replaces: list[tuple[str, str]]) -> None:
+        self._replaces = dict(search_replaces)
+
+        searches = [search for search in self._replaces if search]
+        self._pattern = _compile_searches(searches) if searches else None
+
+    def replace_lines(self, lines: list[str]) -> tuple[list[str], Counter[str]]:
+        """
+        Returns replaced lines & how many times each search string was replaced.
+        """
+        fired: Counter[str] = Counter()
+
+        if self._pattern is None:
+            return list(lines), fired
+
+        def _replace(match: re.Match[str]) -> str:
+            search = match.group()
+            fired[search] += 1
+            return self._replaces[search]
+
+        return [self._pattern.sub(_replace, line) for line in lines], fired
+
+
+@cache
+def _get_compiled_search_replacer(
+    search_replaces: tuple[tuple[str, str], ...],
+) -> SearchReplacer:
+    return SearchReplacer(list(search_replaces))
+
+
+def get_plan_search_replacer(plan: PagePlan) -> SearchReplacer:
+    # Page specific rules come last, overriding global rules with same search.
+    # Pages without own rules share the same compiled global rules.
+    return _get_compiled_search_replacer(plan.search_replaces)
+
+
+def get_search_replacer(page: str) -> SearchReplacer:
+    return get_plan_search_replacer(PageMeta.get_page_plan(page))
+
+
+def _format_fired(count: int) -> str:
+    if not count:
+        return "never fired"
+
+    return f"fired {count} time{'' if count == 1 else 's'}"
+
+
+def get_report(fired_search_replaces: dict[str, Counter[str]]) -> str:
+    """
+    How many times each search/replace rule fired in given pages, rules
+    that never fired included. Global rules are summed over pages.
+    """
+    lines = ["Search/replace rules:"]
+
+    for search, _ in PageMeta.get_global_search_replaces():
+        counts = [fired[search] for fired in fired_search_replaces.values()]
+        pages = sum(1 for count in counts if count)
+        lines.append(
+            f"  {'(all pages)':<30} {search!r:<40} "
+            f"{_format_fired(sum(counts))} on {pages} pages"
+        )
+
+    for name, fired in fired_search_replaces.items():
+        # Some filenames contain linebreaks.
+        printable_name = name.replace("\n", "\\n")
+
+        for search, _ in PageMeta.get_known_search_replaces(name):
+            lines.append(
+                f"  {printable_name:<30} {search!r:<40} {_format_fired(fired[search])}"
+            )
+
+    return "\n".join(lines)
@@ -0,0 +1,73 @@
+import re
+from functools import cache
+
+
+def get_separators_for(letter: str) -> list[str]:
+    return [
+        rf"(\b{letter}[\w\S]+\b,)",  # Capital letter and words ends in comma.
+        rf"(\b{letter}[\w\S]+\b-)",  # Capital letter and words ends in dash, ie. linebreak.
+    ]
+
+
+@cache
+def get_separator_pattern(letter: str) -> re.Pattern[str]:
+    # Compiled once per letter & process. Same as joining separators with "|",
+    # but shared start of separators is matched only once per position.
+    return re.compile(rf"\b{letter}(?:[\w\S]+\b,|[\w\S]+\b-)")
+
+
+def _is_entry(part: str, letter: str) -> bool:
+    # Break into words, omitting spacing the beginning.
+    words = part.lstrip().split(" ")
+
+    # Some exotic parts do not respect length, probably linebreakish thing.
+    # If it breaks, its not an entry.
+    if not words[0]:
+        return False
+
+    # Compare first letter to expected letter of page.
+    if len(words) == 1 and words[0][0].upper() != letter:
+        return False
+
+    # Check if first words ends like entries should.
+    return len(words) == 1 and words[0][-1] in [",", "-"]
+
+
+def segment_entries(content: str, letter: str) -> list[str]:
+    """
+    Split page content to raw entries in one pass over separator matches.
+    Text between separators that does not look like an entry
+    belongs to the entry before it.
+    """
+    raw_entries: list[str] = []
+    entry_parts: list[str] = []
+
+    def _add_part(part: str, is_first: bool) -> None:
+        if not part:
+            return
+
+        if is_first or _is_entry(part, letter):
+            if entry_parts:
+                raw_entries.append(" ".join(entry_parts))
+                entry_parts.clear()
+
+            entry_parts.append(part)
+            return
+
+        # Line may contain linebreaks, which are not required at the beginning.
+        entry_parts.append(part.lstrip("\\n"))
+
+    position = 0
+
+    for match in get_separator_pattern(letter).finditer(content):
+        text_before = content[position : match.start()]  # noqa: E203
+        _add_part(text_before, is_first=position == 0)
+        _add_part(match.group(), is_first=False)
+        position = match.end()
+
+    _add_part(content[position:], is_first=position == 0)
+
+    if entry_parts:
+        raw_entries.append(" ".join(entry_parts))
+
+    return raw_entries
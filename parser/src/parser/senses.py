@@ -0,0 +1,238 @@
+"""
+Parse definitions of an entry into structured senses.
+
+Definitions consist of unnumbered preamble (usually word class, eg. "no.")
+and numbered senses, which may have lettered sub-senses:
+
+    go. 1) komme af; ... Hvitf. VIII 365. — 2) a) aflægges ... b) ...
+
+Definitions are walked word by word once. A marker only opens a sense when
+it is next in its numbering, so stray numbers like "38)" stay as text.
+"""
+
+from typing import Final, NamedTuple
+
+# Numbering kinds in order of appearance, with their first numbers.
+_first_numbers: Final[dict[str, str]] = {"digit": "1", "letter": "a", "greek": "α"}
+
+_sense_break: Final[str] = "—"
+
+_roman_digits: Final[str] = "IVXLCDM"
+
+# Lowercase abbreviations of sources, eg. "sst." (samme sted), are at most this long.
+_max_source_abbreviation_length: Final[int] = 4
+
+
+class Sense(NamedTuple):
+    # None for preamble before first numbered sense.
+    number: str | None
+    text: str
+    # Trailing source citations, eg. "Moth." or "Hvitf. VIII 365."
+    sources: list[str]
+    senses: list["Sense"]
+
+    def to_json(self) -> dict[str, str | None | list[str] | list[dict]]:
+        return {
+            "number": self.number,
+            "text": self.text,
+            "sources": self.sources,
+            "senses": [sense.to_json() for sense in self.senses],
+        }
+
+
+class _OpenSense:
+    __slots__ = ("kind", "number", "words", "senses")
+
+    def __init__(self, kind: str | None, number: str | None) -> None:
+        self.kind = kind
+        self.number = number
+        self.words: list[str] = []
+        self.senses: list[_OpenSense] = []
+
+    def close(self) -> Sense:
+        words = self.words
+
+        if words and words[-1] == _sense_break:
+            words = words[:-1]
+
+        text_words, sources = _split_sources(words)
+
+        return Sense(
+            number=self.number,
+            text=" ".join(text_words),
+            sources=sources,
+            senses=[sense.close() for sense in self.senses],
+        )
+
+
+def _get_marker(word: str) -> tuple[str, str] | None:
+    if len(word) < 2 or word[-1] != ")":
+        return None
+
+    number = word[:-1]
+
+    if number.isdigit() and len(number) <= 2:
+        return "digit", number
+
+    if len(number) == 1 and "a" <= number <= "z":
+        return "letter", number
+
+    if len(number) == 1 and "α" <= number <= "ω":
+        return "greek", number
+
+    return None
+
+
+def _get_next_number(kind: str, number: str) -> str:
+    if kind == "digit":
+        return str(int(number) + 1)
+
+    return chr(ord(number) + 1)
+
+
+def _is_citation_word(word: str) -> bool:
+    # Dates of quotes, eg. "(1542).", are not part of citations.
+    return (
+        (word[0].isupper() or word[0].isdigit()) and "(" not in word and ")" not in word
+    )
+
+
+def _is_volume(word: str) -> bool:
+    number = word.rstrip(".,")
+
+    return bool(number) and all(digit in _roman_digits for digit in number)
+
+
+def _is_source_word(word: str) -> bool:
+    if "(" in word or ")" in word or word.endswith(";"):
+        return False
+
+    return word[0].isupper() or (
+        word.endswith(".") and len(word) <= _max_source_abbreviation_length
+    )
+
+
+def _split_citation(words: list[str], end: int) -> int:
+    """
+    Start of citation ending at given index, or end if there is none.
+    """
+    start = end
+
+    while start > 0 and _is_citation_word(words[start - 1]):
+        # Semicolon ends previous citation or quote.
+        if start < end and words[start - 1].endswith(";"):
+            break
+
+        start -= 1
+
+    first = start
+
+    # Citations begin with an abbreviated source, eg. "Moth." or "Rosenv.,".
+    while start < end and not (
+        words[start][0].isupper() and words[start].endswith((".", ","))
+    ):
+        start += 1
+
+    # Volume & page after source without punctuation, eg. "AB II. 293."
+    # or "sst. I. 315b.".
+    if (
+        0 < start < end - 1
+        and _is_volume(words[start])
+        and words[start + 1][0].isdigit()
+        and _is_source_word(words[start - 1])
+    ):
+        start -= 1
+
+        # Source hyphenated over line break, eg. "Bernt- sen.".
+        if start > 0 and words[start - 1].endswith("-"):
+            start -= 1
+
+        return start
+
+    # Bare source, eg. "Moth" in "abbed; Moth", right after end of sentence
+    # or of previous citation.
+    if (
+        start == end
+        and 0 < first < end
+        and words[first][0].isupper()
+        and words[first - 1].endswith((".", ";"))
+    ):
+        return first
+
+    return start
+
+
+def _split_sources(words: list[str]) -> tuple[list[str], list[str]]:
+    sources: list[str] = []
+    end = len(words)
+
+    while end > 0:
+        start = _split_citation(words, end)
+
+        if start == end:
+            break
+
+        sources.append(" ".join(words[start:end]).rstrip(";"))
+        end = start
+
+        # Only citations separated by semicolons are trailing ones.
+        if end > 0 and not words[end - 1].endswith(";"):
+            break
+
+    sources.reverse()
+
+    return words[:end], sources
+
+
+def parse_senses(definitions: str) -> list[Sense]:
+    preamble = _OpenSense(kind=None, number=None)
+    senses = [preamble]
+    # Innermost open sense last.
+    open_senses: list[_OpenSense] = []
+
+    for word in definitions.split(" "):
+        if not word:
+            continue
+
+        marker = _get_marker(word)
+
+        if marker and _open_sense(senses, open_senses, *marker):
+            continue
+
+        (open_senses[-1] if open_senses else preamble).words.append(word)
+
+    if not preamble.words:
+        senses.remove(preamble)
+
+    return [sense.close() for sense in senses]
+
+
+def _open_sense(
+    senses: list[_OpenSense], open_senses: list[_OpenSense], kind: str, number: str
+) -> bool:
+    """
+    Open new sense for marker if numbering allows it.
+    """
+    for depth, open_sense in enumerate(open_senses):
+        if open_sense.kind != kind:
+            continue
+
+        if number != _get_next_number(kind, open_sense.number or ""):
+            return False
+
+        # Next sibling, close all deeper senses.
+        del open_senses[depth:]
+        sense = _OpenSense(kind=kind, number=number)
+        (open_senses[-1].senses if open_senses else senses).append(sense)
+        open_senses.append(sense)
+
+        return True
+
+    if number != _first_numbers[kind]:
+        return False
+
+    sense = _OpenSense(kind=kind, number=number)
+    (open_senses[-1].senses if open_senses else senses).append(sense)
+    open_senses.append(sense)
+
+    return True
@@ -0,0 +1,276 @@
+"""
+Local HTTP lookup service over built dictionary. Speaks just enough
+HTTP/1.1 for JSON lookups over keep-alive connections:
+
+    GET  /lookup?headword=abbot          entries of headword
+    GET  /prefix?prefix=ab&limit=20      entries of headwords starting with prefix
+    POST /batch {"headwords": [...]}     entries of each headword
+    GET  /metrics                        request counts, latencies & cache hits
+
+Encoded results of lookups are kept in LRU caches by headword & by prefix,
+batches reuse results of single headwords.
+"""
+
+import asyncio
+import json
+from collections import Counter, deque
+from functools import lru_cache
+from time import perf_counter_ns
+from typing import Final, NamedTuple
+from urllib.parse import parse_qs
+
+from src.parser import instrumentation
+from src.parser.lookup import HeadwordIndex, default_prefix_limit
+
+# Latencies of this many latest requests per route are kept for metrics.
+_latency_samples: Final[int] = 10_000
+
+_max_body_size: Final[int] = 1024 * 1024
+
+_reasons: Final[dict[int, str]] = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+}
+
+
+class Request(NamedTuple):
+    method: str
+    target: str
+    body: bytes
+    keep_alive: bool
+
+
+class Response(NamedTuple):
+    status: int
+    body: bytes
+
+
+def _json_response(status: int, value: object) -> Response:
+    return Response(status, json.dumps(value, ensure_ascii=False).encode())
+
+
+def _error_response(status: int, error: str) -> Response:
+    return _json_response(status, {"error": error})
+
+
+def _encode_response(response: Response, keep_alive: bool) -> bytes:
+    head = (
+        f"HTTP/1.1 {response.status} {_reasons[response.status]}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(response.body)}\r\n"
+    )
+
+    if not keep_alive:
+        head += "Connection: close\r\n"
+
+    return (head + "\r\n").encode() + response.body
+
+
+def _parse_head(head: bytes) -> tuple[str, str, str, dict[str, str]]:
+    request_line, *header_lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+    method, target, version = request_line.split(" ")
+    headers = {}
+
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    return method, target, version, headers
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Request | None:
+    """
+    Next request of connection, None when connection was closed.
+    Raises ValueError for malformed requests.
+    """
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+        return None
+
+    method, target, version, headers = _parse_head(head)
+    content_length = int(headers.get("content-length", "0"))
+
+    if not 0 <= content_length <= _max_body_size:
+        raise ValueError("Request body too large")
+
+    try:
+        body = await reader.readexactly(content_length)
+    except asyncio.IncompleteReadError:
+        raise ValueError("Request body shorter than its length")
+
+    return Request(
+        method=method,
+        target=target,
+        body=body,
+        keep_alive=version == "HTTP/1.1"
+        and headers.get("connection", "").lower() != "close",
+    )
+
+
+class LookupServer:
+    _index: HeadwordIndex
+    _latencies: dict[str, deque[int]]
+    _requests: Counter[str]
+
+    def __init__(self, index: HeadwordIndex, cache_size: int = 4096) -> None:
+        self._index = index
+        self._lookup_cached = lru_cache(maxsize=cache_size)(self._lookup)
+        self._lookup_prefix_cached = lru_cache(maxsize=cache_size)(self._lookup_prefix)
+        self._latencies = {}
+        self._requests = Counter()
+
+    def _lookup(self, headword: str) -> bytes:
+        return json.dumps(self._index.lookup(headword), ensure_ascii=False).encode()
+
+    def _lookup_prefix(self, prefix: str, limit: int) -> bytes:
+        entries = self._index.lookup_prefix(prefix, limit=limit)
+        return json.dumps(entries, ensure_ascii=False).encode()
+
+    def _get_lookup(self, parameters: dict[str, list[str]]) -> Response:
+        if "headword" not in parameters:
+            return _error_response(400, "Missing headword")
+
+        return Response(200, self._lookup_cached(parameters["headword"][0]))
+
+    def _get_prefix(self, parameters: dict[str, list[str]]) -> Response:
+        if "prefix" not in parameters:
+            return _error_response(400, "Missing prefix")
+
+        try:
+            limit = int(parameters.get("limit", [default_prefix_limit])[0])
+        except ValueError:
+            return _error_response(400, "Limit should be a number")
+
+        return Response(200, self._lookup_prefix_cached(parameters["prefix"][0], limit))
+
+    def _get(self, target: str) -> Response:
+        path, _, query = target.partition("?")
+        # Blank headword is a headword too, it just has no entries.
+        parameters = parse_qs(query, keep_blank_values=True)
+
+        if path == "/lookup":
+            return self._get_lookup(parameters)
+
+        if path == "/prefix":
+            return self._get_prefix(parameters)
+
+        return _error_response(404, f"No such path: {path}")
+
+    def _post_batch(self, body: bytes) -> Response:
+        try:
+            headwords = json.loads(body)["headwords"]
+        except (ValueError, KeyError, TypeError):
+            return _error_response(400, 'Expected {"headwords": [...]}')
+
+        if not isinstance(headwords, list):
+            return _error_response(400, "Headwords should be a list")
+
+        for index, headword in enumerate(headwords):
+            if not isinstance(headword, str):
+                return _error_response(400, f"Headword {index} should be a string")
+
+        parts = [
+            json.dumps(headword, ensure_ascii=False).encode()
+            + b":"
+            + self._lookup_cached(headword)
+            for headword in headwords
+        ]
+        return Response(200, b"{" + b",".join(parts) + b"}")
+
+    def respond(self, method: str, target: str, body: bytes = b"") -> Response:
+        path = target.partition("?")[0]
+
+        if path == "/batch":
+            if method != "POST":
+                return _error_response(405, "Use POST for batches")
+
+            return self._post_batch(body)
+
+        if method != "GET":
+            return _error_response(405, "Use GET for lookups")
+
+        if path == "/metrics":
+            return _json_response(200, self.get_metrics())
+
+        return self._get(target)
+
+    def _record_latency(self, target: str, nanoseconds: int) -> None:
+        path = target.partition("?")[0]
+        route = (
+            path if path in ("/lookup", "/prefix", "/batch", "/metrics") else "other"
+        )
+
+        self._requests[route] += 1
+
+        if route not in self._latencies:
+            self._latencies[route] = deque(maxlen=_latency_samples)
+
+        self._latencies[route].append(nanoseconds)
+
+    def get_metrics(self) -> dict[str, dict]:
+        routes = {}
+
+        for route, latencies in self._latencies.items():
+            percentiles = instrumentation.get_latency_percentiles(latencies)
+            routes[route] = {
+                "requests": self._requests[route],
+                **{name: round(value, 1) for name, value in percentiles.items()},
+            }
+
+        return {
+            "routes": routes,
+            "cache": {
+                name: {
+                    "hits": cache_info.hits,
+                    "misses": cache_info.misses,
+                    "size": cache_info.currsize,
+                    "max_size": cache_info.maxsize,
+                }
+                for name, cache_info in [
+                    ("lookup", self._lookup_cached.cache_info()),
+                    ("prefix", self._lookup_prefix_cached.cache_info()),
+                ]
+            },
+        }
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except ValueError:
+                    response = _error_response(400, "Malformed request")
+                    writer.write(_encode_response(response, keep_alive=False))
+                    break
+
+                if request is None:
+                    break
+
+                start = perf_counter_ns()
+                response = self.respond(request.method, request.target, request.body)
+                writer.write(_encode_response(response, request.keep_alive))
+                self._record_latency(request.target, perf_counter_ns() - start)
+
+                await writer.drain()
+
+                if not request.keep_alive:
+                    break
+        except ConnectionError:
+            # Client went away, nothing to answer.
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str, port: int) -> asyncio.Server:
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+    async def serve_forever(self, host: str, port: int) -> None:
+        server = await self.start(host, port)
+
+        async with server:
+            await server.serve_forever()
@@ -0,0 +1,229 @@
+"""
+Token dictionary format, all fixed-size integers little-endian:
+
+    header:  magic (4 bytes), version (u32), entry count (u32),
+             token count (u32)
+    entries: entry count * u32 offset of entry in records
+    tokens:  (token count + 1) * u32 offset of token in token heap
+    heap:    UTF-8 tokens, most common first
+    records: per entry: headword length & UTF-8 headword, definition count,
+             per definition: token count & token ids, all varints
+
+Definitions are split to tokens by spaces, so that joining tokens with
+spaces gives the definition back as is. Common tokens, like "no." or
+"Moth.", get smallest ids and fit one byte.
+"""
+
+import struct
+from collections import Counter
+from typing import IO, Final, Iterator
+
+from src.parser import instrumentation
+from src.parser.entry import Entry
+from src.parser.mapped_file import MappedFile
+
+MAGIC: Final[bytes] = b"ODTK"
+VERSION: Final[int] = 1
+
+_header: Final[struct.Struct] = struct.Struct("<4sIII")
+_offset: Final[struct.Struct] = struct.Struct("<I")
+
+# Tokens with ids of one & two byte varints are decoded when opening,
+# they cover most of definitions.
+_preloaded_tokens: Final[int] = 1 << 14
+
+
+def _write_varint(value: int, buffer: bytearray) -> None:
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+
+    buffer.append(value)
+
+
+def _read_varint(buffer: bytes, position: int) -> tuple[int, int]:
+    """
+    Value of varint at position, and position after it.
+    """
+    value = 0
+    shift = 0
+
+    while True:
+        byte = buffer[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+
+        if byte < 0x80:
+            return value, position
+
+        shift += 7
+
+
+class TokenEntryWriter:
+    """
+    Writes entries to token dictionary. Token ids depend on counts of tokens
+    in whole dictionary, so entries are tokenised as they come in and
+    written once all of them are in.
+    """
+
+    _token_file: IO[bytes]
+    _token_counts: Counter[str]
+    _entries: list[tuple[str, list[list[str]]]]
+
+    def __init__(self, token_file: IO[bytes]) -> None:
+        self._token_file = token_file
+        self._token_counts = Counter()
+        self._entries = []
+
+    @instrumentation.timed("writer.tokens")
+    def write(self, entry: Entry) -> None:
+        definitions = [definition.split(" ") for definition in entry.definitions_list]
+
+        for tokens in definitions:
+            self._token_counts.update(tokens)
+
+        self._entries.append((entry.headword, definitions))
+
+    def _get_records(self, token_ids: dict[str, int]) -> tuple[list[int], bytearray]:
+        offsets: list[int] = []
+        records = bytearray()
+
+        for headword, definitions in self._entries:
+            offsets.append(len(records))
+
+            encoded_headword = headword.encode()
+            _write_varint(len(encoded_headword), records)
+            records += encoded_headword
+            _write_varint(len(definitions), records)
+
+            for tokens in definitions:
+                _write_varint(len(tokens), records)
+
+                for token in tokens:
+                    _write_varint(token_ids[token], records)
+
+        return offsets, records
+
+    def finish(self) -> None:
+        tokens = [token for token, _ in self._token_counts.most_common()]
+        offsets, records = self._get_records(
+            {token: token_id for token_id, token in enumerate(tokens)}
+        )
+
+        self._token_file.write(
+            _header.pack(MAGIC, VERSION, len(self._entries), len(tokens))
+        )
+
+        for offset in offsets:
+            self._token_file.write(_offset.pack(offset))
+
+        encoded_tokens = [token.encode() for token in tokens]
+        token_offset = 0
+
+        for encoded_token in encoded_tokens + [b""]:
+            self._token_file.write(_offset.pack(token_offset))
+            token_offset += len(encoded_token)
+
+        self._token_file.write(b"".join(encoded_tokens))
+        self._token_file.write(records)
+
+
+class TokenDictionary(MappedFile):
+    """
+    Read-only view to token dictionary. File is memory-mapped, entries are
+    decoded only when asked for.
+    """
+
+    _count: int
+    _token_count: int
+    _tokens_start: int
+    _heap_start: int
+    _records_start: int
+    _tokens: list[str]
+
+    def __init__(self, file_path: str) -> None:
+        self._count, self._token_count = self._map(
+            file_path, _header, MAGIC, VERSION, "token dictionary"
+        )
+        self._tokens_start = _header.size + self._count * _offset.size
+        self._heap_start = self._tokens_start + (self._token_count + 1) * _offset.size
+        self._records_start = self._heap_start + self._get_token_offset(
+            self._token_count
+        )
+        self._tokens = [
+            self._read_token(token_id)
+            for token_id in range(min(self._token_count, _preloaded_tokens))
+        ]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _get_token_offset(self, token_id: int) -> int:
+        offset: int = _offset.unpack_from(
+            self._mmap, self._tokens_start + token_id * _offset.size
+        )[0]
+        return offset
+
+    def _read_token(self, token_id: int) -> str:
+        start = self._heap_start + self._get_token_offset(token_id)
+        end = self._heap_start + self._get_token_offset(token_id + 1)
+        return self._mmap[start:end].decode()
+
+    def _get_record_offset(self, index: int) -> int:
+        if index == self._count:
+            return len(self._mmap) - self._records_start
+
+        offset: int = _offset.unpack_from(
+            self._mmap, _header.size + index * _offset.size
+        )[0]
+        return offset
+
+    def _get_record(self, index: int) -> bytes:
+        start = self._records_start + self._get_record_offset(index)
+        end = self._records_start + self._get_record_offset(index + 1)
+        return self._mmap[start:end]
+
+    def _decode_definition(self, record: bytes, position: int) -> tuple[str, int]:
+        token_count, position = _read_varint(record, position)
+        preloaded_tokens = self._tokens
+        tokens: list[str] = []
+
+        for _ in range(token_count):
+            token_id = record[position]
+
+            # One byte ids of common tokens are the usual case.
+            if token_id < 0x80:
+                position += 1
+            else:
+                token_id, position = _read_varint(record, position)
+
+            tokens.append(
+                preloaded_tokens[token_id]
+                if token_id < len(preloaded_tokens)
+                else self._read_token(token_id)
+            )
+
+        return " ".join(tokens), position
+
+    def get_entry(self, index: int) -> dict[str, str | list[str]]:
+        """
+        Entry in same form as in JSON output.
+        """
+        record = self._get_record(index)
+
+        headword_length, position = _read_varint(record, 0)
+        headword_end = position + headword_length
+        headword = record[position:headword_end].decode()
+        definition_count, position = _read_varint(record, headword_end)
+
+        definitions: list[str] = []
+
+        for _ in range(definition_count):
+            definition, position = self._decode_definition(record, position)
+            definitions.append(definition)
+
+        return {"headword": headword, "definitions": definitions}
+
+    def iter_entries(self) -> Iterator[dict[str, str | list[str]]]:
+        for index in range(self._count):
+            yield self.get_entry(index)
@@ -0,0 +1,183 @@
+"""
+Watch mode: rebuild dictionary whenever pages or parsing rules change.
+
+Pages are polled for changes. Only changed pages are read & parsed again,
+entries of others come from page cache kept in memory. Parsing rules are
+Python modules, so changing them restarts the process. Page cache then
+only parses again pages whose rules changed.
+"""
+
+import glob
+import os
+import sys
+import time
+from typing import Final
+
+from src.parser import reader, writer
+from src.parser.cache import PageCache
+from src.parser.dictionary import Dictionary, DictionaryPage
+from src.parser.entry import Entry
+
+# Page rules & parsing logic live in modules of parser.
+rules_folder: Final[str] = os.path.dirname(os.path.abspath(__file__))
+
+_FileStats = dict[str, tuple[int, int]]
+
+
+def _get_file_stats(paths: list[str]) -> _FileStats:
+    stats: _FileStats = {}
+
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            # Editors may replace files by removing them first.
+            continue
+
+        stats[path] = (stat.st_size, stat.st_mtime_ns)
+
+    return stats
+
+
+def _get_rule_files() -> list[str]:
+    return sorted(glob.glob(os.path.join(rules_folder, "*.py")))
+
+
+class Watcher:
+    _folder: str
+    _json_file_path: str
+    _pretty: bool
+    _senses: bool
+    _cache: PageCache
+    _page_stats: _FileStats
+    _rule_stats: _FileStats
+    _dictionary_pages: dict[str, DictionaryPage]
+    _encoded_entries: dict[Entry, str]
+
+    def __init__(
+        self,
+        folder: str = reader.input_folder,
+        json_file_path: str = "dictionary.json",
+        pretty: bool = True,
+        senses: bool = False,
+        cache: PageCache | None = None,
+    ) -> None:
+        self._folder = folder
+        self._json_file_path = json_file_path
+        self._pretty = pretty
+        self._senses = senses
+        # Saving cache takes longer than rebuilding, it is saved on exit only.
+        self._cache = cache or PageCache(autosave=False)
+        self._page_stats = {}
+        self._rule_stats = _get_file_stats(_get_rule_files())
+        self._dictionary_pages = {}
+        self._encoded_entries = {}
+
+    def _get_page_paths(self) -> list[str]:
+        return [
+            os.path.join(self._folder, name)
+            for name in reader.get_ordered_files(self._folder)
+        ]
+
+    def update_pages(self) -> list[str]:
+        """
+        Read pages changed since previous update. Returns names of
+        changed, added & removed pages.
+        """
+        page_stats = _get_file_stats(self._get_page_paths())
+        changed: list[str] = []
+        dictionary_pages: dict[str, DictionaryPage] = {}
+
+        for path, stat in page_stats.items():
+            name = os.path.basename(path)
+            dictionary_page = self._dictionary_pages.get(name)
+
+            if dictionary_page is None or self._page_stats.get(path) != stat:
+                dictionary_page = DictionaryPage(
+                    name=name, lines=reader.read_file(path)
+                )
+                changed.append(name)
+
+            dictionary_pages[name] = dictionary_page
+
+        changed.extend(set(self._dictionary_pages) - set(dictionary_pages))
+
+        self._page_stats = page_stats
+        self._dictionary_pages = dictionary_pages
+
+        return changed
+
+    def are_rules_changed(self) -> bool:
+        return _get_file_stats(_get_rule_files()) != self._rule_stats
+
+    def build(self) -> int:
+        """
+        Parse pages missing from cache and rewrite dictionary.
+        Returns amount of entries written.
+        """
+        dictionary = Dictionary(
+            dictionary_pages=list(self._dictionary_pages.values()), cache=self._cache
+        )
+        entries = dictionary.get_entries()
+
+        # Replace output at once, so that it is never read half written.
+        temporary_file_path = f"{self._json_file_path}.tmp"
+
+        with open(temporary_file_path, "w") as json_file:
+            writer.write_entries(
+                entries,
+                [
+                    writer.JsonEntryWriter(
+                        json_file,
+                        pretty=self._pretty,
+                        senses=self._senses,
+                        encoded_entries=self._encoded_entries,
+                    )
+                ],
+            )
+
+        os.replace(temporary_file_path, self._json_file_path)
+
+        # Forget encodings of entries no longer in dictionary.
+        self._encoded_entries = {
+            entry: self._encoded_entries[entry] for entry in entries
+        }
+
+        return len(entries)
+
+    def _restart(self) -> None:
+        # Rules are code: start again to load them.
+        print("Parsing rules changed, restarting")
+        self._cache.save()
+        sys.stdout.flush()
+        os.execv(sys.executable, [sys.executable] + sys.argv)
+
+    def watch(self, interval: float = 0.2) -> None:
+        self.update_pages()
+        start = time.perf_counter()
+        amount = self.build()
+        print(f"Wrote {amount} entries in {time.perf_counter() - start:.2f}s")
+
+        try:
+            while True:
+                time.sleep(interval)
+                self._check()
+        except KeyboardInterrupt:
+            # Stopping watch is not an error.
+            self._cache.save()
+
+    def _check(self) -> None:
+        if self.are_rules_changed():
+            self._restart()
+
+        changed = self.update_pages()
+
+        if not changed:
+            return
+
+        start = time.perf_counter()
+        amount = self.build()
+        print(
+            f"{', '.join(changed)} changed, wrote {amount} entries "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
@@ -1,15 +1,349 @@
+import gzip
+import hashlib
+import io
 import json
+import lzma
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Final, Iterable, NamedTuple, Protocol, TextIO
 
+from src.parser import instrumentation
+from src.parser.binary import BinaryEntryWriter
+from src.parser.columnar import ColumnarEntryWriter
+from src.parser.database import SqliteEntryWriter
 from src.parser.dictionary import Dictionary
+from src.parser.entry import Entry
+from src.parser.tokens import TokenEntryWriter
 
+_write_buffer_size: Final[int] = 1024 * 1024
 
-def write_dictionary_to_json_file(dictionary: Dictionary) -> None:
-    entries = dictionary.get_entries()
+shards_manifest_file: Final[str] = "manifest.json"
 
-    json_entries = json.dumps([entry.to_json() for entry in entries], indent=2)
+# Supported compressions and suffixes of their files.
+COMPRESSIONS: Final[dict[str, str]] = {"gzip": ".gz", "xz": ".xz"}
 
-    file_path = "dictionary.json"
+# Default level of Dart's gzip in minifier, much faster than 9 for similar size.
+_gzip_default_level: Final[int] = 6
 
-    # Open the file in write mode and write the JSON string to it
-    with open(file_path, "w") as json_file:
-        json_file.write(json_entries)
+# Shard files are named by ASCII letters, so that they are easy to fetch.
+_shard_file_names: Final[dict[str, str]] = {"Æ": "ae", "Ø": "oe", "Å": "aa"}
+
+# Shard of headwords not starting with a letter, eg. empty ones.
+OTHER_SHARD: Final[str] = "other"
+
+
+class EntryWriter(Protocol):
+    def write(self, entry: Entry) -> None: ...
+
+    def finish(self) -> None: ...
+
+
+class JsonEntryWriter:
+    """
+    Writes entries as JSON array, one entry at a time.
+    Pretty output matches json.dumps(..., indent=2) of the whole list.
+
+    Encoded entries, when given, are reused for entries written before with
+    same options, and filled with new ones.
+    """
+
+    _json_file: TextIO
+    _pretty: bool
+    _senses: bool
+    _encoded_entries: dict[Entry, str] | None
+    _is_first: bool
+
+    def __init__(
+        self,
+        json_file: TextIO,
+        pretty: bool = True,
+        senses: bool = False,
+        encoded_entries: dict[Entry, str] | None = None,
+    ) -> None:
+        self._json_file = json_file
+        self._pretty = pretty
+        self._senses = senses
+        self._encoded_entries = encoded_entries
+        self._is_first = True
+
+    def _encode(self, entry: Entry) -> str:
+        entry_json = entry.to_json(with_senses=self._senses)
+
+        if self._pretty:
+            # Nest entry one level deeper than the array itself.
+            return json.dumps(entry_json, indent=2).replace("\n", "\n  ")
+
+        return json.dumps(entry_json, separators=(",", ":"))
+
+    @instrumentation.timed("writer.json")
+    def write(self, entry: Entry) -> None:
+        if self._encoded_entries is None:
+            json_entry = self._encode(entry)
+        else:
+            json_entry = self._encoded_entries.get(entry, "")
+
+            if not json_entry:
+                json_entry = self._encode(entry)
+                self._encoded_entries[entry] = json_entry
+
+        if self._is_first:
+            self._json_file.write("[\n  " if self._pretty else "[")
+            self._is_first = False
+        else:
+            self._json_file.write(",\n  " if self._pretty else ",")
+
+        self._json_file.write(json_entry)
+
+    def finish(self) -> None:
+        if self._is_first:
+            # No entries, empty array.
+            self._json_file.write("[]")
+        else:
+            self._json_file.write("\n]" if self._pretty else "]")
+
+
+def _compress(content: bytes, compression: str | None, level: int | None) -> bytes:
+    if compression == "gzip":
+        # Without modification time, unchanged content compresses to same bytes.
+        return gzip.compress(
+            content,
+            compresslevel=_gzip_default_level if level is None else level,
+            mtime=0,
+        )
+
+    if compression == "xz":
+        return lzma.compress(content, preset=level)
+
+    return content
+
+
+def _open_json_file(
+    stack: ExitStack, file_path: str, compression: str | None, level: int | None
+) -> TextIO:
+    """
+    JSON file to write to, compressed as it is written.
+    """
+    if compression is None:
+        return stack.enter_context(
+            open(file_path, "w", buffering=_write_buffer_size, encoding="utf-8")
+        )
+
+    raw_file = stack.enter_context(open(file_path, "wb", buffering=_write_buffer_size))
+    compressed_file: io.BufferedIOBase
+
+    if compression == "gzip":
+        compressed_file = gzip.GzipFile(
+            fileobj=raw_file,
+            mode="wb",
+            compresslevel=_gzip_default_level if level is None else level,
+            mtime=0,
+        )
+    else:
+        compressed_file = lzma.LZMAFile(raw_file, mode="wb", preset=level)
+
+    # Closed before raw file, so that compressed stream is finished first.
+    return stack.enter_context(io.TextIOWrapper(compressed_file, encoding="utf-8"))
+
+
+class Shard(NamedTuple):
+    letter: str
+    file: str
+    entries: int
+    bytes: int
+    sha256: str
+
+
+def _write_shard(
+    folder: str,
+    letter: str,
+    entries: int,
+    content: bytes,
+    compression: str | None,
+    compression_level: int | None,
+) -> Shard:
+    # Runs in worker threads: zlib, lzma & file writes release the GIL.
+    content = _compress(content, compression, compression_level)
+
+    suffix = COMPRESSIONS[compression] if compression else ""
+    file = f"{_shard_file_names.get(letter, letter.lower())}.json{suffix}"
+
+    with open(os.path.join(folder, file), "wb") as shard_file:
+        shard_file.write(content)
+
+    return Shard(
+        letter=letter,
+        file=file,
+        entries=entries,
+        bytes=len(content),
+        sha256=hashlib.sha256(content).hexdigest(),
+    )
+
+
+class ShardedJsonEntryWriter:
+    """
+    Writes entries to one JSON file per first letter of headwords, and
+    manifest of shards with their sizes & content hashes. Shards are
+    encoded once all entries are in, and compressed & written in parallel
+    threads while next ones are encoded.
+    """
+
+    _folder: str
+    _pretty: bool
+    _senses: bool
+    _compression: str | None
+    _compression_level: int | None
+    _workers: int
+    _letters: dict[str, list[Entry]]
+
+    def __init__(
+        self,
+        folder: str,
+        pretty: bool = True,
+        senses: bool = False,
+        compression: str | None = None,
+        compression_level: int | None = None,
+        workers: int = 1,
+    ) -> None:
+        self._folder = folder
+        self._pretty = pretty
+        self._senses = senses
+        self._compression = compression
+        self._compression_level = compression_level
+        self._workers = workers
+        self._letters = {}
+
+    @staticmethod
+    def _get_letter(headword: str) -> str:
+        letter = headword[:1].upper()
+
+        return letter if letter.isalpha() else OTHER_SHARD
+
+    def write(self, entry: Entry) -> None:
+        self._letters.setdefault(self._get_letter(entry.headword), []).append(entry)
+
+    def _encode_shard(self, entries: list[Entry]) -> bytes:
+        json_file = io.StringIO()
+        write_entries(
+            entries,
+            [JsonEntryWriter(json_file, pretty=self._pretty, senses=self._senses)],
+        )
+
+        return json_file.getvalue().encode()
+
+    def _write_shards(self) -> list[Shard]:
+        with ThreadPoolExecutor(max_workers=max(1, self._workers)) as executor:
+            futures = [
+                executor.submit(
+                    _write_shard,
+                    self._folder,
+                    letter,
+                    len(entries),
+                    self._encode_shard(entries),
+                    self._compression,
+                    self._compression_level,
+                )
+                for letter, entries in self._letters.items()
+            ]
+
+            return [future.result() for future in futures]
+
+    @instrumentation.timed("writer.shards")
+    def finish(self) -> None:
+        if not os.path.exists(self._folder):
+            os.makedirs(self._folder)
+
+        shards = self._write_shards()
+
+        with open(os.path.join(self._folder, shards_manifest_file), "w") as outfile:
+            json.dump(
+                {
+                    "version": 1,
+                    "compression": self._compression,
+                    "shards": [shard._asdict() for shard in shards],
+                },
+                outfile,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+
+def write_entries(entries: Iterable[Entry], entry_writers: list[EntryWriter]) -> None:
+    # Entries are iterated only once, no matter how many outputs there are.
+    for entry in entries:
+        for entry_writer in entry_writers:
+            entry_writer.write(entry)
+
+    for entry_writer in entry_writers:
+        entry_writer.finish()
+
+
+def write_entries_to_json(
+    entries: Iterable[Entry], json_file: TextIO, pretty: bool = True
+) -> None:
+    write_entries(entries, [JsonEntryWriter(json_file, pretty=pretty)])
+
+
+def write_dictionary_to_json_file(
+    dictionary: Dictionary, file_path: str = "dictionary.json", pretty: bool = True
+) -> None:
+    with open(file_path, "w", buffering=_write_buffer_size) as json_file:
+        write_entries_to_json(dictionary.iter_entries(), json_file, pretty=pretty)
+
+
+def write_dictionary_to_files(
+    dictionary: Dictionary,
+    json_file_path: str = "dictionary.json",
+    pretty: bool = True,
+    senses: bool = False,
+    binary_file_path: str | None = None,
+    sqlite_file_path: str | None = None,
+    shards_folder_path: str | None = None,
+    columnar_file_path: str | None = None,
+    tokens_file_path: str | None = None,
+    compression: str | None = None,
+    compression_level: int | None = None,
+    workers: int = 1,
+) -> None:
+    """
+    With compression, JSON files & shards are compressed as they are written.
+    Suffix of compression is not added to JSON file paths.
+    """
+    with ExitStack() as stack:
+        json_file = _open_json_file(
+            stack, json_file_path, compression, compression_level
+        )
+        entry_writers: list[EntryWriter] = [
+            JsonEntryWriter(json_file, pretty=pretty, senses=senses)
+        ]
+
+        if binary_file_path:
+            binary_file = stack.enter_context(open(binary_file_path, "wb"))
+            entry_writers.append(BinaryEntryWriter(binary_file))
+
+        if sqlite_file_path:
+            entry_writers.append(SqliteEntryWriter(sqlite_file_path))
+
+        if tokens_file_path:
+            tokens_file = stack.enter_context(open(tokens_file_path, "wb"))
+            entry_writers.append(TokenEntryWriter(tokens_file))
+
+        if columnar_file_path:
+            columnar_file = _open_json_file(
+                stack, columnar_file_path, compression, compression_level
+            )
+            entry_writers.append(ColumnarEntryWriter(columnar_file))
+
+        if shards_folder_path:
+            entry_writers.append(
+                ShardedJsonEntryWriter(
+                    shards_folder_path,
+                    pretty=pretty,
+                    senses=senses,
+                    compression=compression,
+                    compression_level=compression_level,
+                    workers=workers,
+                )
+            )
+
+        write_entries(dictionary.iter_entries(), entry_writers)
@@ -1,3 +1,35 @@
+import os
+import shutil
+from typing import Final
+
+from src.parser.dictionary import DictionaryPage
+
+# Consecutive pages with entries continuing over page boundaries,
+# page name => test file.
+SPLIT_PAGES: Final[dict[str, str]] = {
+    "3554-vævel.txt": "split-v-to-x.txt",
+    "3555-ybisk.txt": "split-x-to-y.txt",
+    "3556-ydekorn.txt": "split-y-continuation.txt",
+}
+
+
 def open_test_file(file: str) -> list[str]:
     with open(f"./tests/test_data/{file}", "r") as infile:
         return infile.readlines()
+
+
+def get_split_dictionary_pages() -> list[DictionaryPage]:
+    return [
+        DictionaryPage(name=name, lines=open_test_file(file))
+        for name, file in SPLIT_PAGES.items()
+    ]
+
+
+def copy_split_pages(folder: str) -> None:
+    """
+    Copy split pages to folder under their page names, like in text folder.
+    """
+    for name, file in SPLIT_PAGES.items():
+        shutil.copyfile(
+            os.path.join("./tests/test_data", file), os.path.join(folder, name)
+        )
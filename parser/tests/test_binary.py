@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import pytest
+
+from src.parser.binary import BinaryDictionary, BinaryEntryWriter
+from src.parser.entry import Entry, EntryStatus
+
+entries = [
+    Entry(headword="Yde", definitions="go. give.", status=EntryStatus.VALID),
+    Entry(headword="Abbot", definitions="no. abbed. Moth.", status=EntryStatus.VALID),
+    Entry(
+        headword="Ærlighedsbrev",
+        definitions="no. 1) brev. — 2) vidnesbyrd.",
+        status=EntryStatus.VALID,
+    ),
+    Entry(headword="Yde", definitions="no. ydelse.", status=EntryStatus.VALID),
+]
+
+
+def _write_binary_dictionary(file_path: Path) -> None:
+    with open(file_path, "wb") as binary_file:
+        binary_writer = BinaryEntryWriter(binary_file)
+
+        for entry in entries:
+            binary_writer.write(entry)
+
+        binary_writer.finish()
+
+
+def test_looks_up_entries_by_headword(tmp_path: Path) -> None:
+    file_path = tmp_path / "dictionary.bin"
+    _write_binary_dictionary(file_path)
+
+    with BinaryDictionary(str(file_path)) as dictionary:
+        assert len(dictionary) == 4
+
+        assert dictionary.lookup("Abbot") == [entries[1].to_json()]
+        assert dictionary.lookup("Ærlighedsbrev") == [entries[2].to_json()]
+
+        # Same headwords are kept in dictionary order.
+        assert dictionary.lookup("Yde") == [entries[0].to_json(), entries[3].to_json()]
+
+        assert dictionary.lookup("Abbed") == []
+        assert dictionary.lookup("Ø") == []
+
+
+def test_refuses_other_files(tmp_path: Path) -> None:
+    file_path = tmp_path / "dictionary.json"
+    file_path.write_text("[]" * 10)
+
+    with pytest.raises(ValueError):
+        BinaryDictionary(str(file_path))
@@ -0,0 +1,76 @@
+from collections import Counter
+from pathlib import Path
+
+from src.parser.cache import PageCache
+from src.parser.dictionary import Dictionary
+from src.parser.page import ParsedPage
+from tests import get_split_dictionary_pages, open_test_file
+
+
+def test_cached_entries_match_parsed_entries(tmp_path: Path) -> None:
+    cache_file = str(tmp_path / "cache" / "pages.pickle")
+    dictionary_pages = get_split_dictionary_pages()
+
+    expected_entries = Dictionary(dictionary_pages).get_entries()
+
+    # First build fills the cache, second one is read from it.
+    first_entries = Dictionary(
+        dictionary_pages, cache=PageCache(cache_file)
+    ).get_entries()
+
+    cache = PageCache(cache_file)
+    for dictionary_page in dictionary_pages:
+        assert cache.get(dictionary_page.name, dictionary_page.lines) is not None
+
+    second_entries = Dictionary(dictionary_pages, cache=cache).get_entries()
+
+    assert first_entries == expected_entries
+    assert second_entries == expected_entries
+
+
+def test_changed_page_is_not_read_from_cache(tmp_path: Path) -> None:
+    cache = PageCache(str(tmp_path / "pages.pickle"))
+    lines = open_test_file("simple-page.txt")
+
+    parsed_page = ParsedPage(entries=[], fired_search_replaces=Counter())
+    cache.set("19-afklappe.txt", lines, parsed_page)
+
+    assert cache.get("19-afklappe.txt", lines) == parsed_page
+    assert cache.get("19-afklappe.txt", lines[:-1]) is None
+
+    # Same content, but different rules apply to another page name.
+    assert cache.get("71-arbejdelse.txt", lines) is None
+
+
+def test_unused_pages_are_dropped_from_cache(tmp_path: Path) -> None:
+    cache_file = str(tmp_path / "pages.pickle")
+    lines = open_test_file("simple-page.txt")
+
+    cache = PageCache(cache_file)
+    cache.set(
+        "19-afklappe.txt",
+        lines,
+        ParsedPage(entries=[], fired_search_replaces=Counter()),
+    )
+    cache.save()
+
+    # Page is not requested during next build.
+    PageCache(cache_file).save()
+
+    assert PageCache(cache_file).get("19-afklappe.txt", lines) is None
+
+
+def test_unused_pages_are_kept_without_pruning(tmp_path: Path) -> None:
+    cache_file = str(tmp_path / "pages.pickle")
+    dictionary_pages = get_split_dictionary_pages()
+
+    Dictionary(dictionary_pages, cache=PageCache(cache_file)).get_entries()
+
+    # Selective build of last page only.
+    Dictionary(
+        dictionary_pages[2:], cache=PageCache(cache_file, prune=False)
+    ).get_entries()
+
+    cache = PageCache(cache_file)
+    for dictionary_page in dictionary_pages:
+        assert cache.get(dictionary_page.name, dictionary_page.lines) is not None
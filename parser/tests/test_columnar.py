@@ -0,0 +1,45 @@
+import io
+
+import pytest
+
+from src.parser.columnar import ColumnarDictionary, ColumnarEntryWriter
+from src.parser.entry import Entry, EntryStatus
+from src.parser.writer import write_entries
+
+entries = [
+    Entry(headword="Abbot", definitions="no. abbed. Moth.", status=EntryStatus.VALID),
+    Entry(
+        headword="Afkom",
+        definitions="go. 1) komme bort fra. — 2) komme af.",
+        status=EntryStatus.VALID,
+    ),
+    Entry(headword="Ørn", definitions="no.", status=EntryStatus.VALID),
+    Entry(headword="Øse", definitions="no.", status=EntryStatus.VALID),
+]
+
+
+def _get_columnar_file() -> io.StringIO:
+    json_file = io.StringIO()
+    write_entries(entries, [ColumnarEntryWriter(json_file)])
+    json_file.seek(0)
+
+    return json_file
+
+
+def test_rebuilds_entries() -> None:
+    dictionary = ColumnarDictionary(_get_columnar_file())
+
+    assert len(dictionary) == 4
+    assert dictionary.get_entry(1) == entries[1].to_json()
+    assert list(dictionary.iter_entries()) == [entry.to_json() for entry in entries]
+
+
+def test_stores_repeated_definitions_once() -> None:
+    json_file = _get_columnar_file()
+
+    assert json_file.getvalue().count('"no."') == 1
+
+
+def test_rejects_other_formats() -> None:
+    with pytest.raises(ValueError):
+        ColumnarDictionary(io.StringIO('[{"headword": "Abbot"}]'))
@@ -30,3 +30,25 @@ def test_column_combining() -> None:
     result = columns.parse_column(input, "dummy-name")
 
     assert result == expected
+
+
+def test_column_combining_without_divider() -> None:
+    input = [
+        "Meta line about the page",
+        # Middle of line falls on "skrive", gap between words is used instead.
+        "treedsk. KS 120; at skrive x for v, at skære een en skak-",
+        # No gaps near the middle either.
+        "oc afbetalehvisdekundeskyldigovermeget",
+    ]
+
+    expected = [
+        "Meta line about the page",
+        "treedsk. KS 120; at skrive x",
+        "oc afbetalehvisdeku",
+        " for v, at skære een en skak-",
+        "ndeskyldigovermeget",
+    ]
+
+    result = columns.parse_column(input, "dummy-name")
+
+    assert result == expected
@@ -0,0 +1,55 @@
+import sqlite3
+from pathlib import Path
+
+from src.parser import database
+from src.parser.database import SqliteEntryWriter
+from src.parser.entry import Entry, EntryStatus
+
+entries = [
+    Entry(headword="Abbot", definitions="no. abbed. Moth.", status=EntryStatus.VALID),
+    Entry(
+        headword="Afkom",
+        definitions="go. 1) komme bort fra. Saxo. — 2) komme af. Moth.",
+        status=EntryStatus.VALID,
+    ),
+    Entry(headword="Abbot", definitions="no. ærkeabbed.", status=EntryStatus.VALID),
+]
+
+
+def _write_database(file_path: str) -> None:
+    sqlite_writer = SqliteEntryWriter(file_path)
+
+    for entry in entries:
+        sqlite_writer.write(entry)
+
+    sqlite_writer.finish()
+
+
+def test_looks_up_entries_by_headword(tmp_path: Path) -> None:
+    file_path = str(tmp_path / "dictionary.sqlite")
+    _write_database(file_path)
+
+    with sqlite3.connect(file_path) as connection:
+        assert database.lookup(connection, "Abbot") == [
+            ["no. abbed. Moth."],
+            ["no. ærkeabbed."],
+        ]
+        assert database.lookup(connection, "Afkom") == [entries[1].definitions_list]
+        assert database.lookup(connection, "Abbed") == []
+
+
+def test_searches_definitions(tmp_path: Path) -> None:
+    file_path = str(tmp_path / "dictionary.sqlite")
+
+    # Rewriting should replace the previous database.
+    _write_database(file_path)
+    _write_database(file_path)
+
+    with sqlite3.connect(file_path) as connection:
+        assert database.search_definitions(connection, "Moth") == [
+            ("Abbot", "no. abbed. Moth."),
+            ("Afkom", "2) komme af. Moth."),
+        ]
+        assert database.search_definitions(connection, "saxo") == [
+            ("Afkom", "1) komme bort fra. Saxo. —"),
+        ]
@@ -1,6 +1,13 @@
-from src.parser.dictionary import Dictionary, DictionaryPage
-from src.parser.entry import EntryStatus
-from tests import open_test_file
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from src.parser import columns
+from src.parser.cache import PageCache
+from src.parser.dictionary import Dictionary, DictionaryPage, _merge_partial_entries
+from src.parser.entry import Entry, EntryStatus
+from tests import SPLIT_PAGES, get_split_dictionary_pages, open_test_file
 
 
 def test_combines_entries() -> None:
@@ -95,10 +102,10 @@ def test_combines_entries() -> None:
         "i forb x for v (u) 0: 10 for 5 (efter talværdien som romertal) i ud- tryk om at bedrage; for L "
         "at skriffve 0, for V at sætte X. Ska 11 (= vår V schriven X. (Lappenbergs udg) 1. v 187); TkA I. "
         '131 (ovf. u. fram); I SP €2" (ovf. IV. 662211); med x for v jeg vilde let mit regenskab forklare. '
-        "ABI. 58b; jeg X for V har skrevet og været falsk og treedsk. KS 120; at dskrive x for v, at skære "
+        "ABI. 58b; jeg X for V har skrevet og været falsk og treedsk. KS 120; at skrive x for v, at skære "
         'een en skak- lose 0: veed, hvad een tjener, saa hand derved skakker noget. PSO IL. 27"; — P Pårs '
         "B 3 53 (ovt. II. 4893); at skrive 9 for 1, naar du skrev X' for V: BruunR II. 327 (rim på du). — "
-        "(forstå) sin v og x 9: f., hvad der er for-elagtigt; den karl forstaar sin v og x, faar Rygen sogn "
+        "(forstå) sin v og x 9: f., hvad der er for- delagtigt; den karl forstaar sin v og x, faar Rygen sogn "
         "for Mors annex. BruuoR II. 288. Jf Hex fort t. skab 217 (ovf. IV. 589b2:). Samme brug i i Sv "
         "(se Dalin: X) og T (se Sanders: W)."
     )
@@ -108,7 +115,137 @@ def test_combines_entries() -> None:
     assert entries[31].status == EntryStatus.VALID
 
     assert entries[31].definitions == (
-        "no. ko, der gaves som afgift; hwat som the giffuit haffueere en two marck for een ydhe koo (1466). "
+        "no. ko, der gaves som afgift; hwat som the giffuit haffue mere en two marck for een ydhe koo (1466). "
         "DC 183; 58 ydhekiør (1523). DM4 II. 4; tilltallit kronens bønder for the icke ville yde hannom "
         "theris yde-koer (1553). Rsv I 210. Jf Bernts Il. 179; skatteko ovf."
     )
+
+
+def test_parallel_entries_match_serial_entries() -> None:
+    dictionary_pages = get_split_dictionary_pages()
+
+    serial_entries = Dictionary(dictionary_pages).get_entries()
+    parallel_entries = Dictionary(dictionary_pages, workers=2).get_entries()
+
+    # Partials spanning page boundaries should be combined just like in serial run.
+    assert parallel_entries == serial_entries
+
+
+def test_stream_entries_match_eager_entries() -> None:
+    eager_entries = Dictionary(get_split_dictionary_pages()).get_entries()
+
+    # Pages from generator should only be read once entries are iterated.
+    streamed_pages = (
+        DictionaryPage(name=name, lines=open_test_file(file))
+        for name, file in SPLIT_PAGES.items()
+    )
+    dictionary = Dictionary(streamed_pages, stream=True)
+
+    assert list(dictionary.iter_entries()) == eager_entries
+
+    # Stream was consumed by iterating, it can not be parsed again.
+    with pytest.raises(ValueError):
+        dictionary.get_entries()
+
+
+def test_combines_consecutive_partial_entries() -> None:
+    entries = [
+        Entry(headword="Yde", definitions="go. give", status=EntryStatus.VALID),
+        Entry(
+            headword="oc", definitions="yde", status=EntryStatus.PART_OF_PREVIOUS_ENTRY
+        ),
+        Entry(
+            headword="Moth.", definitions="", status=EntryStatus.PART_OF_PREVIOUS_ENTRY
+        ),
+        Entry(headword="Ydre", definitions="adj. ydre.", status=EntryStatus.VALID),
+    ]
+
+    expected_entries = [
+        Entry(
+            headword="Yde",
+            definitions="go. give oc yde Moth. ",
+            status=EntryStatus.VALID,
+        ),
+        Entry(headword="Ydre", definitions="adj. ydre.", status=EntryStatus.VALID),
+    ]
+
+    assert list(_merge_partial_entries(entries)) == expected_entries
+
+
+def test_parses_entries_once() -> None:
+    dictionary = Dictionary(
+        (
+            DictionaryPage(name=name, lines=open_test_file(file))
+            for name, file in list(SPLIT_PAGES.items())[:2]
+        ),
+        stream=True,
+    )
+
+    entries = dictionary.get_entries()
+
+    # Pages were a generator, they can not be parsed again.
+    assert dictionary.get_entries() is entries
+    assert list(dictionary.iter_entries()) == entries
+
+
+def test_parses_pages_on_demand(monkeypatch: pytest.MonkeyPatch) -> None:
+    parsed_names: list[str] = []
+    parse_column = columns.parse_column
+
+    def _parse_column(page: list[str], name: str) -> list[str]:
+        parsed_names.append(name)
+        return parse_column(page, name)
+
+    monkeypatch.setattr(columns, "parse_column", _parse_column)
+
+    dictionary = Dictionary(
+        [
+            DictionaryPage(name=name, lines=open_test_file(file))
+            for name, file in [
+                ("19-afklappe.txt", "simple-page.txt"),
+                ("20-afkyndige.txt", "simple-page.txt"),
+            ]
+        ]
+    )
+
+    assert dictionary.get_page_count() == 2
+    assert not parsed_names
+
+    page = dictionary.get_pages(1)[0]
+
+    assert parsed_names == ["20-afkyndige.txt"]
+    assert dictionary.get_pages(1)[0] is page
+    assert page.get_entries() is page.get_entries()
+
+    dictionary.get_entries()
+
+    assert parsed_names == ["20-afkyndige.txt", "19-afklappe.txt"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_collects_fired_search_replaces(workers: int, tmp_path: Path) -> None:
+    dictionary_pages = [
+        DictionaryPage(
+            name="97-balstyrig.txt",
+            lines=open_test_file("simple-page-rotated-for-better-ocr.txt"),
+        ),
+        DictionaryPage(name="19-afklappe.txt", lines=open_test_file("simple-page.txt")),
+    ]
+    expected = {"97-balstyrig.txt": Counter({"Bandsdoc.": 1}), "19-afklappe.txt": {}}
+
+    dictionary = Dictionary(dictionary_pages, workers=workers)
+    dictionary.get_entries()
+
+    assert dictionary.get_fired_search_replaces() == expected
+
+    # Second build reads pages from cache.
+    cache_file = str(tmp_path / "pages.pickle")
+    Dictionary(
+        dictionary_pages, workers=workers, cache=PageCache(cache_file)
+    ).get_entries()
+    cached_dictionary = Dictionary(
+        dictionary_pages, workers=workers, cache=PageCache(cache_file)
+    )
+    cached_dictionary.get_entries()
+
+    assert cached_dictionary.get_fired_search_replaces() == expected
@@ -1,3 +1,5 @@
+import pickle
+
 from src.parser.entry import Entry, EntryStatus
 
 
@@ -60,3 +62,42 @@ def test_parses_incorrectly_numbered_definitions_list() -> None:
     expected_definitions = ["Foo bar baz 1) bar bar 3) baz baz 2) foo foo "]
 
     assert entry.definitions_list == expected_definitions
+
+
+def test_keeps_senses_of_definitions_between_uses() -> None:
+    entry = Entry(
+        headword="Bable",
+        definitions="go. 1) at tale — uforståeligt. Moth; — 2) snakke.  ",
+        status=EntryStatus.VALID,
+    )
+
+    expected_definitions = [
+        "go.",
+        "1) at tale — uforståeligt. Moth; —",
+        "2) snakke.",
+    ]
+
+    assert entry.definitions_list == expected_definitions
+    assert entry.definitions_list == expected_definitions
+    assert pickle.loads(pickle.dumps(entry)).definitions_list == expected_definitions
+
+
+def test_combines_all_partial_entries() -> None:
+    first = Entry(headword="Yde", definitions="go. give —", status=EntryStatus.VALID)
+    second = Entry(
+        headword="øl.", definitions="1) yde", status=EntryStatus.PART_OF_PREVIOUS_ENTRY
+    )
+    third = Entry(
+        headword="Moth.",
+        definitions="2) ydelse.",
+        status=EntryStatus.PART_OF_PREVIOUS_ENTRY,
+    )
+
+    combined = Entry.combine_entries(first, second, third)
+
+    assert combined == Entry(
+        headword="Yde",
+        definitions="go. give — øl. 1) yde Moth. 2) ydelse.",
+        status=EntryStatus.VALID,
+    )
+    assert combined.definitions_list == ["go. give — øl.", "1) yde Moth.", "2) ydelse."]
@@ -0,0 +1,75 @@
+from typing import Iterator
+
+import pytest
+
+from src.parser import instrumentation
+from src.parser.dictionary import Dictionary, DictionaryPage
+from tests import open_test_file
+
+
+@pytest.fixture
+def enabled_instrumentation() -> Iterator[None]:
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+@instrumentation.timed("outer")
+def _outer() -> int:
+    return _inner() + _inner()
+
+
+@instrumentation.timed("inner")
+def _inner() -> int:
+    return 1
+
+
+def test_does_not_measure_when_disabled() -> None:
+    instrumentation.reset()
+
+    assert _outer() == 2
+    assert instrumentation.get_stage_calls() == {}
+
+
+def test_counts_nested_stages(enabled_instrumentation: None) -> None:
+    assert _outer() == 2
+
+    assert instrumentation.get_stage_calls() == {"outer": 1, "inner": 2}
+    assert set(instrumentation.get_stage_seconds()) == {"outer", "inner"}
+
+
+def test_measures_stages_and_pages(enabled_instrumentation: None) -> None:
+    dictionary = Dictionary(
+        [
+            DictionaryPage(
+                name="19-afklappe.txt", lines=open_test_file("simple-page.txt")
+            ),
+            DictionaryPage(
+                name="87-axelkøbstad.txt", lines=open_test_file("split-a-to-b.txt")
+            ),
+        ]
+    )
+    entries = dictionary.get_entries()
+
+    calls = instrumentation.get_stage_calls()
+
+    # Split page is parsed as two pages.
+    assert calls["columns.parse_column"] == 3
+    assert calls["page.get_entries"] == 3
+    assert calls["entry.from_raw_entry"] >= len(entries)
+
+    slowest_pages = [name for name, _ in instrumentation.get_slowest_pages(1)]
+    assert slowest_pages[0] in ["19-afklappe.txt", "87-axelkøbstad.txt"]
+    assert "Slowest 1 pages:" in instrumentation.get_report(slowest_pages=1)
+
+
+def test_gets_latency_percentiles() -> None:
+    percentiles = instrumentation.get_latency_percentiles(
+        latency * 1_000 for latency in range(1, 102)
+    )
+    assert percentiles == {"p50_us": 51.0, "p90_us": 91.0, "p99_us": 100.0}
+
+    # Single latency is every percentile.
+    assert set(instrumentation.get_latency_percentiles([2_000]).values()) == {2.0}
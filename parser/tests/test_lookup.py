@@ -0,0 +1,27 @@
+from src.parser.lookup import HeadwordIndex
+
+entries = [
+    {"headword": "Abbot", "definitions": ["no. abbed."]},
+    {"headword": "Abe", "definitions": ["no. abekat."]},
+    {"headword": "Abbot", "definitions": ["no. klosterforstander."]},
+    {"headword": "Afkom", "definitions": ["no. efterkommere."]},
+    {"headword": "Ørn", "definitions": ["no."]},
+]
+
+
+def test_looks_up_headwords_case_insensitively() -> None:
+    index = HeadwordIndex(entries)
+
+    assert len(index) == 5
+    assert index.lookup("abbot") == [entries[0], entries[2]]
+    assert index.lookup("ØRN") == [entries[4]]
+    assert index.lookup("Abbed") == []
+
+
+def test_looks_up_prefixes_in_alphabetical_order() -> None:
+    index = HeadwordIndex(entries)
+
+    assert index.lookup_prefix("ab") == [entries[0], entries[2], entries[1]]
+    assert index.lookup_prefix("Ab", limit=2) == [entries[0], entries[2]]
+    assert index.lookup_prefix("a", limit=0) == []
+    assert index.lookup_prefix("x") == []
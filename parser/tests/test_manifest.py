@@ -0,0 +1,99 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from src.parser import page_meta
+from src.parser.dictionary import Dictionary
+from src.parser.manifest import Manifest
+from tests import copy_split_pages, get_split_dictionary_pages
+
+
+@pytest.fixture
+def text_folder(tmp_path: Path) -> str:
+    folder = tmp_path / "text"
+    folder.mkdir()
+    copy_split_pages(str(folder))
+
+    return str(folder)
+
+
+def test_lists_pages_with_letters(text_folder: str, tmp_path: Path) -> None:
+    manifest = Manifest(text_folder, str(tmp_path / "manifest.json"))
+
+    assert [(page.number, page.letters) for page in manifest.get_pages()] == [
+        (3554, ["V", "X"]),
+        (3555, ["X", "Y"]),
+        (3556, ["Y"]),
+    ]
+
+
+def test_rehashes_only_changed_pages(text_folder: str, tmp_path: Path) -> None:
+    manifest_file = str(tmp_path / "manifest.json")
+    pages = Manifest(text_folder, manifest_file).get_pages()
+
+    with open(os.path.join(text_folder, "3556-ydekorn.txt"), "a") as outfile:
+        outfile.write("Ydre, adj. ydre.\n")
+
+    changed_pages = Manifest(text_folder, manifest_file).get_pages()
+
+    assert changed_pages[:2] == pages[:2]
+    assert changed_pages[2].content_hash != pages[2].content_hash
+
+
+def test_selects_pages_with_continuing_entries(
+    text_folder: str, tmp_path: Path
+) -> None:
+    full_entries = Dictionary(get_split_dictionary_pages()).get_entries()
+
+    manifest = Manifest(text_folder, str(tmp_path / "manifest.json"))
+    dictionary_pages = manifest.select(page_numbers=range(3555, 3556))
+
+    assert [page.name for page in dictionary_pages] == [
+        "3555-ybisk.txt",
+        "3556-ydekorn.txt",
+    ]
+    assert dictionary_pages[1].continuation_only
+
+    entries = Dictionary(dictionary_pages).get_entries()
+
+    # Partial "X" continues from previous page, it's dropped.
+    # "Ydeko" continues to next page, which is merged.
+    first = next(
+        index for index, entry in enumerate(full_entries) if entry.headword == "Ybisk"
+    )
+    assert entries == full_entries[first : first + len(entries)]  # noqa: E203
+    assert entries[-1].headword == "Ydeko"
+    assert entries[-1].definitions.endswith("Jf Bernts Il. 179; skatteko ovf.")
+
+
+def test_selects_pages_by_letter(text_folder: str, tmp_path: Path) -> None:
+    manifest = Manifest(text_folder, str(tmp_path / "manifest.json"))
+
+    assert [page.name for page in manifest.select(letters=["Y"])] == [
+        "3555-ybisk.txt",
+        "3556-ydekorn.txt",
+    ]
+    assert [page.name for page in manifest.select(letters=["V"])] == [
+        "3554-vævel.txt",
+        "3555-ybisk.txt",
+    ]
+
+
+def test_resolves_letters_from_current_rules(
+    text_folder: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manifest_file = str(tmp_path / "manifest.json")
+    Manifest(text_folder, manifest_file)
+
+    # Page rules change, page files don't.
+    monkeypatch.setitem(
+        page_meta.PAGES_WITH_EXCEPTIONAL_LETTERS, "3556-ydekorn.txt", ["Y", "Z"]
+    )
+
+    manifest = Manifest(text_folder, manifest_file)
+
+    assert manifest.get_pages()[2].letters == ["Y", "Z"]
+    assert [page.name for page in manifest.select(letters=["Z"])] == [
+        "3556-ydekorn.txt"
+    ]
@@ -0,0 +1,29 @@
+import io
+import struct
+from pathlib import Path
+
+from src.parser.mapped_file import MappedFile, TemporaryHeap
+
+_header = struct.Struct("<4sII")
+
+
+def test_writes_heap_after_table() -> None:
+    heap = TemporaryHeap()
+    output_file = io.BytesIO()
+
+    assert heap.write(b"Abbot") == 0
+    assert heap.write(b"no. abbed.") == 5
+
+    output_file.write(b"table")
+    heap.copy_to(output_file)
+
+    assert output_file.getvalue() == b"tableAbbotno. abbed."
+
+
+def test_maps_file_with_header(tmp_path: Path) -> None:
+    file_path = tmp_path / "dictionary.bin"
+    file_path.write_bytes(_header.pack(b"ODDB", 1, 3) + b"heap")
+
+    with MappedFile() as mapped_file:
+        assert mapped_file._map(str(file_path), _header, b"ODDB", 1, "test") == [3]
+        assert mapped_file._mmap[_header.size :] == b"heap"  # noqa: E203
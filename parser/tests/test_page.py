@@ -387,3 +387,16 @@ def test_parses_rotated_and_re_ocrd_page() -> None:
 
     assert [entry.headword for entry in entries3] == expected_headwords3
     assert [entry.status for entry in entries3] == expected_statuses3
+
+
+def test_reports_fired_search_replaces() -> None:
+    page_input = _single_column_test_file(
+        file="simple-page-rotated-for-better-ocr.txt",
+        name="97-balstyrig.txt",
+    )
+
+    page = Page(lines=page_input, name="97-balstyrig.txt")
+    page_without_rules = Page(lines=page_input, name="98-bandsdag.txt")
+
+    assert page.get_fired_search_replaces() == {"Bandsdoc.": 1}
+    assert not page_without_rules.get_fired_search_replaces()
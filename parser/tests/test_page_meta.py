@@ -0,0 +1,36 @@
+from src.parser.page_meta import PageMeta, PagePlan
+
+
+def test_resolves_page_plan_once() -> None:
+    plan = PageMeta.get_page_plan("1783-midsunds.txt")
+
+    assert plan == PagePlan(
+        name="1783-midsunds.txt",
+        meta_line_index=0,
+        split_point=None,
+        letters=("M",),
+        search_replaces=(
+            ("afforåret.Moth.—Mid-", "afforåret. Moth. —Mid-"),
+            ("åest,", "dest,"),
+        ),
+        column_breaks=(
+            ("midttiden afforåret.Moth.—Mid- lemmand; han (2: Jesus) er eth med-", 31),
+        ),
+    )
+    assert PageMeta.get_page_plan("1783-midsunds.txt") is plan
+
+
+def test_resolves_plan_of_split_page() -> None:
+    plan = PageMeta.get_page_plan("87-axelkøbstad.txt")
+
+    assert plan.meta_line_index == 0
+    assert plan.split_point == 50
+    assert plan.letters == ("A", "B")
+
+
+def test_resolves_plan_of_irregular_meta_line() -> None:
+    plan = PageMeta.get_page_plan("1549-kølve.txt")
+
+    assert plan.meta_line_index == 2
+    assert plan.split_point is None
+    assert plan.letters == ("K",)
@@ -73,7 +73,7 @@ def test_splits_page_correctly() -> None:
 
     # Axeltorg was originally line-splitted headword. Ensure no content was lost in parsing.
     expected_content = (
-        "no. lovlig udsalgsplads forpå axel tilførte varer; tbet føre the till tyskeland, som the aff arildtid pleege at "
+        "no. lovlig udsalgsplads forpå axel tilførte varer; tbet føre the till tyskeland, som the aff arildztid pleege at "
         "føre till svineborgh, som er theres rette axel torgh (1480). Fynske Aktstk. 90; the haftde sielft ingen axeltoxff "
         "(1941). Geb. Ark. Årsb. TIL till. 33; ingen borger maakiøbe øxen paa landsbyerne, dog bor-geme i kiøbstederne "
         "dermet ikke skal være formeent at købe paa deris axel- tore (1615). Rosenv., G1. L. IV. 816; bønderne skulle "
@@ -160,10 +160,10 @@ def test_splits_page_of_numbers_in_column_separators() -> None:
 
     assert x_entries[0].definitions == (
         '€2" (ovf. IV. 662211); med x for v jeg vilde let mit regenskab forklare. ABI. 58b; '
-        "jeg X for V har skrevet og været falsk og treedsk. KS 120; at dskrive x for v, at skære "
+        "jeg X for V har skrevet og været falsk og treedsk. KS 120; at skrive x for v, at skære "
         'een en skak- lose 0: veed, hvad een tjener, saa hand derved skakker noget. PSO IL. 27"; — '
         "P Pårs B 3 53 (ovt. II. 4893); at skrive 9 for 1, naar du skrev X' for V: BruunR II. 327 "
-        "(rim på du). — (forstå) sin v og x 9: f., hvad der er for-elagtigt; den karl forstaar sin v "
+        "(rim på du). — (forstå) sin v og x 9: f., hvad der er for- delagtigt; den karl forstaar sin v "
         "og x, faar Rygen sogn for Mors annex. BruuoR II. 288. Jf Hex fort t. skab 217 (ovf. IV. "
         "589b2:). Samme brug i i Sv (se Dalin: X) og T (se Sanders: W)."
     )
@@ -240,7 +240,7 @@ def test_splits_page_with_irregular_meta_line() -> None:
     assert g_entries[4].definitions == "se u. gjord."
     assert g_entries[-1].definitions == (
         "no. kvist; forgyldte taarne-flag nu kugle-smelted dratter, bruun-blan-glassered steen "
-        "fra goflingenedstator (1075). Stolpe, Daxs- pressen i Dmrk. IL 82. Smlen. Molb. Diall: giævling."
+        "fra goflingen »ueedstator (1075). Stolpe, Daxs- pressen i Dmrk. IL 82. Smlen. Molb. Diall: giævling."
     )
 
 
@@ -330,8 +330,8 @@ def test_splits_page_with_letter_and_entry_expections() -> None:
 
     assert p_entries[0].definitions == "se på."
     assert p_entries[7].definitions == (
-        "no. en art forstening; ComD $ 90 (ovf. II 483 3.23) = | bufonius,» i krotenstein. Navnene "
-        "skrive sig fra,at forsteningen mentes at danne sig i padders hoved, jf Rinm: paddsten; Nemn I. 710-11; "
+        "no. en art forstening; ComD $ 90 (ovf. II 483 3.23) = | bufonius, » i krotenstein. Navnene "
+        "skrive sig fra, at forsteningen mentes at danne sig i padders hoved, jf Rinm: paddsten; Nemn I. 710-11; "
         "tudsesten udf. Over- troisk brug, jf Frisch L551a: kroten- stein."
     )
     assert p_entries[-1].definitions == "se paje."
@@ -0,0 +1,49 @@
+from pathlib import Path
+
+import pytest
+
+from src.parser import reader
+from src.parser.pack import PagePack
+
+PAGES = {
+    "10-foo.txt": "10    Foo— Bar\nFoo, no. bar. | Bar, go.\n",
+    "2-baz.txt": "2    Baz— Baz\r\nBaz, no. —\n\nlast line without linebreak",
+    "1435-(Hellig)\nKorsaften.txt": "1435    (Hellig) Korsaften\nHellig, adj.\n",
+}
+
+
+@pytest.fixture
+def text_folder(tmp_path: Path) -> Path:
+    folder = tmp_path / "text"
+    folder.mkdir()
+
+    for name, text in PAGES.items():
+        (folder / name).write_bytes(text.encode())
+
+    return folder
+
+
+def test_reads_same_pages_from_pack(
+    text_folder: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    pack_file = str(tmp_path / "text.pack")
+
+    assert reader.pack_files(str(text_folder), pack_file) == 3
+
+    files = reader.read_files(str(text_folder))
+
+    assert [name for name, _ in files] == [
+        "2-baz.txt",
+        "10-foo.txt",
+        "1435-(Hellig)\nKorsaften.txt",
+    ]
+    assert list(reader.iter_pack(pack_file)) == files
+
+
+def test_rejects_other_files(tmp_path: Path) -> None:
+    other_file = tmp_path / "dictionary.bin"
+    other_file.write_bytes(b"ODDB" + bytes(8))
+
+    with pytest.raises(ValueError):
+        PagePack(str(other_file))
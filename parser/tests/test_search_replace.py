@@ -0,0 +1,62 @@
+from collections import Counter
+
+from src.parser.search_replace import SearchReplacer, get_report, get_search_replacer
+
+
+def test_replaces_all_rules_in_one_pass() -> None:
+    search_replacer = SearchReplacer(
+        [("Bøttelort", "Røttelort"), ("Røtteskår", "Røtteskar,"), ("Bøve", "Røve")]
+    )
+
+    lines, fired = search_replacer.replace_lines(
+        ["Bøttelort, no. foo Bøve", "bar Røtteskår baz", "Bøve"]
+    )
+
+    assert lines == ["Røttelort, no. foo Røve", "bar Røtteskar, baz", "Røve"]
+    assert fired == {"Bøttelort": 1, "Røtteskår": 1, "Bøve": 2}
+
+
+def test_prefers_longest_search() -> None:
+    search_replacer = SearchReplacer(
+        [("Moth.", "Moth. "), ("Moth.Smlgn", "Moth. Smlgn"), ("Moth", "Moth.")]
+    )
+
+    lines, _ = search_replacer.replace_lines(["Moth.Smlgn Moth.foo Moth bar"])
+
+    assert lines == ["Moth. Smlgn Moth. foo Moth. bar"]
+
+
+def test_does_not_touch_lines_without_rules() -> None:
+    lines = ["Ablat se oblat."]
+
+    replaced_lines, fired = SearchReplacer([]).replace_lines(lines)
+
+    assert replaced_lines == lines
+    assert replaced_lines is not lines
+    assert not fired
+
+
+def test_uses_page_specific_rules() -> None:
+    lines, fired = get_search_replacer("1-abelig.txt").replace_lines(
+        ["werden. Ablat se oblat."]
+    )
+
+    assert lines == ["werden. Ablat, se oblat."]
+    assert fired == {"Ablat se oblat.": 1}
+
+    assert get_search_replacer("2-abild.txt").replace_lines(lines)[0] == lines
+
+
+def test_reports_rules_fired_per_page() -> None:
+    report = get_report(
+        {
+            "97-balstyrig.txt": Counter({"Bandsdoc.": 2}),
+            "1-abelig.txt": Counter(),
+            "19-afklappe.txt": Counter(),
+        }
+    )
+
+    assert report.splitlines()[1:] == [
+        f"  {'97-balstyrig.txt':<30} {repr('Bandsdoc.'):<40} fired 2 times",
+        f"  {'1-abelig.txt':<30} {repr('Ablat se oblat.'):<40} never fired",
+    ]
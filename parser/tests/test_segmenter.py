@@ -0,0 +1,24 @@
+from src.parser import segmenter
+
+
+def test_segments_entries_by_headwords() -> None:
+    content = "af\nbar. —\nAfklappe, go. foo\nbar.\nAfklare, go. baz."
+
+    # Text before first headword is kept as partial of previous page.
+    assert segmenter.segment_entries(content, "A") == [
+        "af\nbar. —\n",
+        "Afklappe,  go. foo\nbar.\n",
+        "Afklare,  go. baz.",
+    ]
+
+
+def test_only_segments_by_letter_of_page() -> None:
+    content = "Afkom, no. efterkommere i Bergen, Ribe og Viborg."
+
+    assert segmenter.segment_entries(content, "A") == [
+        "Afkom,  no. efterkommere i Bergen, Ribe og Viborg."
+    ]
+
+
+def test_reuses_compiled_separator_pattern() -> None:
+    assert segmenter.get_separator_pattern("B") is segmenter.get_separator_pattern("B")
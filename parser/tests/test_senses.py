@@ -0,0 +1,129 @@
+import pickle
+
+from src.parser.entry import Entry, EntryStatus
+from src.parser.senses import Sense, parse_senses
+
+
+def test_parses_unnumbered_definitions_with_source() -> None:
+    expected_senses = [
+        Sense(number=None, text="no. abbed.", sources=["Moth."], senses=[])
+    ]
+
+    assert parse_senses("no. abbed. Moth.") == expected_senses
+
+
+def test_parses_trailing_sources_without_dot() -> None:
+    assert parse_senses("no. abbed; Moth") == [
+        Sense(number=None, text="no. abbed;", sources=["Moth"], senses=[])
+    ]
+    assert parse_senses("no. slecten. Hvitf. VIII 365") == [
+        Sense(number=None, text="no. slecten.", sources=["Hvitf. VIII 365"], senses=[])
+    ]
+    # Names within text are not sources.
+    assert parse_senses("no. efterkommere i Aalborg")[0].sources == []
+
+
+def test_parses_sources_without_punctuation_before_volume() -> None:
+    # From fixture pages, "Time", "Afladspenninge" & "Ydeko".
+    assert parse_senses("tegne; en lang og farlig strid. AB II. 293.") == [
+        Sense(
+            number=None,
+            text="tegne; en lang og farlig strid.",
+            sources=["AB II. 293."],
+            senses=[],
+        )
+    ]
+    assert parse_senses("no. raab uden aflad. sst. I. 315b.") == [
+        Sense(
+            number=None,
+            text="no. raab uden aflad.",
+            sources=["sst. I. 315b."],
+            senses=[],
+        )
+    ]
+    assert parse_senses("no. 58 ydhekiør (1523). DM4 II. 4; Rsv I 210.") == [
+        Sense(
+            number=None,
+            text="no. 58 ydhekiør (1523).",
+            sources=["DM4 II. 4", "Rsv I 210."],
+            senses=[],
+        )
+    ]
+    # Source names ending in roman digits are not volumes.
+    assert parse_senses("»o. sagte lyd. M.")[0].sources == ["M."]
+
+
+def test_parses_numbered_senses_with_sources() -> None:
+    definitions = (
+        "go. 1) komme (bort) fra; affkomme. N. D. Mag. VI. 104; "
+        "guit bliffae (1549). Rosenv., Gl. D. I. 71; N. D. Mag. 1. 814. — "
+        "2) komme af; slecten. Hvitf. VIII 365."
+    )
+
+    expected_senses = [
+        Sense(number=None, text="go.", sources=[], senses=[]),
+        Sense(
+            number="1",
+            text="komme (bort) fra; affkomme. N. D. Mag. VI. 104; guit bliffae (1549).",
+            sources=["Rosenv., Gl. D. I. 71", "N. D. Mag. 1. 814."],
+            senses=[],
+        ),
+        Sense(
+            number="2",
+            text="komme af; slecten.",
+            sources=["Hvitf. VIII 365."],
+            senses=[],
+        ),
+    ]
+
+    assert parse_senses(definitions) == expected_senses
+
+
+def test_parses_sub_senses() -> None:
+    definitions = (
+        "no. 1) barn. — 2) af barn. a) fra barn af. b) i barselseng. 3) frugtsommelig."
+    )
+
+    senses = parse_senses(definitions)
+
+    assert [sense.number for sense in senses] == [None, "1", "2", "3"]
+    assert senses[2].text == "af barn."
+    assert [(sense.number, sense.text) for sense in senses[2].senses] == [
+        ("a", "fra barn af."),
+        ("b", "i barselseng."),
+    ]
+
+
+def test_keeps_out_of_sequence_numbers_as_text() -> None:
+    definitions = "no. 1) bar 3) baz 2) foo 38) bar"
+
+    senses = parse_senses(definitions)
+
+    assert [sense.number for sense in senses] == [None, "1", "2"]
+    assert senses[1].text == "bar 3) baz"
+    assert senses[2].text == "foo 38) bar"
+
+
+def test_writes_senses_to_entry_json() -> None:
+    entry = Entry(
+        headword="Abbot", definitions="no. abbed. Moth.", status=EntryStatus.VALID
+    )
+
+    assert entry.to_json() == {"headword": "Abbot", "definitions": ["no. abbed. Moth."]}
+    assert entry.to_json(with_senses=True)["senses"] == [
+        {"number": None, "text": "no. abbed.", "sources": ["Moth."], "senses": []}
+    ]
+
+
+def test_keeps_senses_of_entry_between_uses() -> None:
+    entry = Entry(
+        headword="Abbot", definitions="no. abbed. Moth.", status=EntryStatus.VALID
+    )
+
+    assert entry.senses is entry.senses
+
+    # Senses are parsed again after unpickling, eg. from page cache.
+    unpickled_entry = pickle.loads(pickle.dumps(entry))
+    assert unpickled_entry._senses is None
+    assert unpickled_entry.senses == entry.senses
+    assert unpickled_entry == entry
@@ -0,0 +1,109 @@
+import asyncio
+import json
+
+from src.parser.lookup import HeadwordIndex
+from src.parser.server import LookupServer
+
+entries = [
+    {"headword": "Abbot", "definitions": ["no. abbed."]},
+    {"headword": "Abe", "definitions": ["no. abekat."]},
+    {"headword": "Ørn", "definitions": ["no."]},
+]
+
+
+def _get_server() -> LookupServer:
+    return LookupServer(HeadwordIndex(entries), cache_size=2)
+
+
+def test_answers_lookups() -> None:
+    server = _get_server()
+
+    response = server.respond("GET", "/lookup?headword=%C3%B8rn")
+    assert response.status == 200
+    assert json.loads(response.body) == [entries[2]]
+
+    response = server.respond("GET", "/prefix?prefix=ab&limit=1")
+    assert json.loads(response.body) == [entries[0]]
+
+    response = server.respond("POST", "/batch", b'{"headwords": ["abe", "x"]}')
+    assert json.loads(response.body) == {"abe": [entries[1]], "x": []}
+
+    response = server.respond("POST", "/batch", b'{"headwords": [""]}')
+    assert json.loads(response.body) == {"": []}
+    assert json.loads(server.respond("GET", "/lookup?headword=").body) == []
+
+
+def test_answers_errors() -> None:
+    server = _get_server()
+
+    assert server.respond("GET", "/lookup").status == 400
+    assert server.respond("GET", "/prefix?prefix=a&limit=many").status == 400
+    assert server.respond("POST", "/batch", b"[]").status == 400
+    assert server.respond("POST", "/batch", b'{"headwords": [1]}').status == 400
+    assert server.respond("POST", "/batch", b'{"headwords": "abe"}').status == 400
+    assert server.respond("GET", "/batch").status == 405
+    assert server.respond("POST", "/lookup?headword=abe").status == 405
+    assert server.respond("GET", "/unknown").status == 404
+
+
+def test_caches_lookups() -> None:
+    server = _get_server()
+
+    server.respond("GET", "/lookup?headword=abe")
+    server.respond("GET", "/lookup?headword=abe")
+    # Batches reuse responses of single lookups.
+    server.respond("POST", "/batch", b'{"headwords": ["abe"]}')
+
+    cache = server.get_metrics()["cache"]["lookup"]
+    assert (cache["hits"], cache["misses"], cache["size"]) == (2, 1, 1)
+
+
+async def _request_over_connection() -> tuple[list[bytes], dict]:
+    server = await _get_server().start("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+    responses = []
+
+    # Both requests go over same keep-alive connection.
+    for target in ["/lookup?headword=abbot", "/metrics"]:
+        writer.write(f"GET {target} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        head = await reader.readuntil(b"\r\n\r\n")
+        content_length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+        responses.append(head + await reader.readexactly(content_length))
+
+    writer.close()
+    server.close()
+    await server.wait_closed()
+
+    return responses, json.loads(responses[1].split(b"\r\n\r\n")[1])
+
+
+def test_serves_over_http() -> None:
+    responses, metrics = asyncio.run(_request_over_connection())
+
+    assert responses[0].startswith(b"HTTP/1.1 200 OK\r\n")
+    assert responses[0].endswith(json.dumps([entries[0]]).encode())
+    assert metrics["routes"]["/lookup"]["requests"] == 1
+
+
+async def _send_truncated_body() -> bytes:
+    server = await _get_server().start("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+    writer.write(b"POST /batch HTTP/1.1\r\nContent-Length: 100\r\n\r\n{}")
+    writer.write_eof()
+    response = await reader.read()
+
+    writer.close()
+    server.close()
+    await server.wait_closed()
+
+    return response
+
+
+def test_answers_truncated_body() -> None:
+    assert asyncio.run(_send_truncated_body()).startswith(
+        b"HTTP/1.1 400 Bad Request\r\n"
+    )
@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from benchmarks.synthetic_corpus import SyntheticCorpus, write_corpus
+from src.parser import reader
+from src.parser.dictionary import Dictionary, DictionaryPage
+
+
+def test_parses_synthetic_pages_without_noise() -> None:
+    pages = list(SyntheticCorpus(seed=1, noise_rate=0.0).generate(60))
+
+    dictionary = Dictionary(
+        [DictionaryPage(name=page.name, lines=page.lines) for page in pages]
+    )
+
+    expected_headwords = [headword for page in pages for headword in page.headwords]
+
+    assert [entry.headword for entry in dictionary.get_entries()] == expected_headwords
+
+
+def test_generates_same_corpus_from_same_seed() -> None:
+    first = list(SyntheticCorpus(seed=2).generate(30))
+    second = list(SyntheticCorpus(seed=2).generate(30))
+    other = list(SyntheticCorpus(seed=3).generate(30))
+
+    assert first == second
+    assert first != other
+
+
+def test_writes_pages_readable_in_order(tmp_path: Path) -> None:
+    write_corpus(str(tmp_path), 30, SyntheticCorpus(seed=4))
+
+    names = [name for name, _ in reader.read_files(str(tmp_path))]
+
+    assert len(names) == 30
+    assert [int(name.split("-")[0]) for name in names] == list(range(30))
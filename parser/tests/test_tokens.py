@@ -0,0 +1,57 @@
+from pathlib import Path
+
+import pytest
+
+from src.parser.entry import Entry, EntryStatus
+from src.parser.tokens import TokenDictionary, TokenEntryWriter
+
+entries = [
+    Entry(headword="Abbot", definitions="no. abbed. Moth.", status=EntryStatus.VALID),
+    Entry(
+        headword="Ærlighedsbrev",
+        definitions="no. 1) brev  til  Moth. — 2) vidnesbyrd. Moth.",
+        status=EntryStatus.VALID,
+    ),
+    Entry(headword="Yde", definitions="go.", status=EntryStatus.VALID),
+    # More tokens than are decoded when opening, with ids of several bytes.
+    Entry(
+        headword="Ø",
+        definitions=" ".join(f"ord{number}" for number in range(20_000)),
+        status=EntryStatus.VALID,
+    ),
+]
+
+
+def _write_token_dictionary(file_path: Path) -> None:
+    with open(file_path, "wb") as token_file:
+        token_writer = TokenEntryWriter(token_file)
+
+        for entry in entries:
+            token_writer.write(entry)
+
+        token_writer.finish()
+
+
+def test_decodes_entries(tmp_path: Path) -> None:
+    file_path = tmp_path / "dictionary.tokens"
+    _write_token_dictionary(file_path)
+
+    with TokenDictionary(str(file_path)) as dictionary:
+        assert len(dictionary) == 4
+        assert dictionary.get_entry(1) == entries[1].to_json()
+        assert list(dictionary.iter_entries()) == [entry.to_json() for entry in entries]
+
+
+def test_stores_common_tokens_once(tmp_path: Path) -> None:
+    file_path = tmp_path / "dictionary.tokens"
+    _write_token_dictionary(file_path)
+
+    assert file_path.read_bytes().count(b"Moth.") == 1
+
+
+def test_refuses_other_files(tmp_path: Path) -> None:
+    file_path = tmp_path / "dictionary.json"
+    file_path.write_text("[]" * 10)
+
+    with pytest.raises(ValueError):
+        TokenDictionary(str(file_path))
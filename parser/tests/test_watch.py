@@ -0,0 +1,57 @@
+import json
+import os
+from pathlib import Path
+
+from src.parser import reader
+from src.parser.cache import PageCache
+from src.parser.dictionary import Dictionary, DictionaryPage
+from src.parser.watch import Watcher
+from tests import SPLIT_PAGES, copy_split_pages
+
+
+def _get_expected_json(folder: Path) -> list[dict]:
+    dictionary = Dictionary(
+        [
+            DictionaryPage(name=name, lines=reader.read_file(str(folder / name)))
+            for name in SPLIT_PAGES
+        ]
+    )
+
+    return [entry.to_json() for entry in dictionary.get_entries()]
+
+
+def test_rebuilds_changed_pages(tmp_path: Path) -> None:
+    folder = tmp_path / "text"
+    folder.mkdir()
+    copy_split_pages(str(folder))
+
+    json_file_path = tmp_path / "dictionary.json"
+    cache = PageCache(str(tmp_path / "pages.pickle"), autosave=False)
+    watcher = Watcher(str(folder), str(json_file_path), cache=cache)
+
+    assert watcher.update_pages() == list(SPLIT_PAGES)
+    assert watcher.update_pages() == []
+
+    watcher.build()
+
+    with open(json_file_path, "r") as json_file:
+        assert json.load(json_file) == _get_expected_json(folder)
+
+    with open(folder / "3555-ybisk.txt", "r") as page_file:
+        lines = page_file.readlines()
+
+    lines[7] = lines[7].replace("skakker noget", "skakkede noget")
+
+    with open(folder / "3555-ybisk.txt", "w") as page_file:
+        page_file.writelines(lines)
+
+    assert watcher.update_pages() == ["3555-ybisk.txt"]
+
+    watcher.build()
+
+    with open(json_file_path, "r") as json_file:
+        assert json.load(json_file) == _get_expected_json(folder)
+        assert "skakkede noget" in json_file_path.read_text()
+
+    # Cache is saved only when asked to.
+    assert not os.path.exists(tmp_path / "pages.pickle")
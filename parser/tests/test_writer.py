@@ -0,0 +1,158 @@
+import gzip
+import io
+import json
+import lzma
+import os
+from pathlib import Path
+from typing import IO, Callable
+
+import pytest
+
+from src.parser.dictionary import Dictionary, DictionaryPage
+from src.parser.entry import Entry, EntryStatus
+from src.parser.writer import (
+    JsonEntryWriter,
+    ShardedJsonEntryWriter,
+    write_dictionary_to_files,
+    write_entries,
+    write_entries_to_json,
+)
+from tests import open_test_file
+
+entries = [
+    Entry(headword="Abbot", definitions="no. abbed. Moth.", status=EntryStatus.VALID),
+    Entry(
+        headword="Afkom",
+        definitions='go. 1) komme "bort" fra. — 2) komme af.',
+        status=EntryStatus.VALID,
+    ),
+]
+
+
+def test_writes_pretty_json_like_json_dumps() -> None:
+    json_file = io.StringIO()
+
+    write_entries_to_json(entries, json_file)
+
+    expected = json.dumps([entry.to_json() for entry in entries], indent=2)
+
+    assert json_file.getvalue() == expected
+
+
+def test_writes_compact_json() -> None:
+    json_file = io.StringIO()
+
+    write_entries_to_json(iter(entries), json_file, pretty=False)
+
+    assert "\n" not in json_file.getvalue()
+    assert json.loads(json_file.getvalue()) == [entry.to_json() for entry in entries]
+
+
+def test_writes_empty_json_array() -> None:
+    pretty_file = io.StringIO()
+    compact_file = io.StringIO()
+
+    write_entries_to_json([], pretty_file)
+    write_entries_to_json([], compact_file, pretty=False)
+
+    assert pretty_file.getvalue() == json.dumps([], indent=2)
+    assert compact_file.getvalue() == "[]"
+
+
+def test_reuses_encoded_entries() -> None:
+    encoded_entries = {entries[0]: '{"headword": "Encoded"}'}
+    json_file = io.StringIO()
+
+    write_entries(
+        entries, [JsonEntryWriter(json_file, encoded_entries=encoded_entries)]
+    )
+
+    assert json.loads(json_file.getvalue())[0] == {"headword": "Encoded"}
+    assert list(encoded_entries) == entries
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_writes_shards_per_letter(tmp_path: Path, workers: int) -> None:
+    shard_entries = entries + [
+        Entry(headword="Ørn", definitions="no. ørn.", status=EntryStatus.VALID)
+    ]
+
+    write_entries(
+        shard_entries, [ShardedJsonEntryWriter(str(tmp_path), workers=workers)]
+    )
+
+    with open(tmp_path / "manifest.json", "r") as manifest_file:
+        shards = json.load(manifest_file)["shards"]
+
+    assert [(shard["letter"], shard["file"], shard["entries"]) for shard in shards] == [
+        ("A", "a.json", 2),
+        ("Ø", "oe.json", 1),
+    ]
+
+    for shard, expected_entries in zip(shards, [entries, shard_entries[2:]]):
+        with open(tmp_path / shard["file"], "r") as shard_file:
+            assert json.load(shard_file) == [
+                entry.to_json() for entry in expected_entries
+            ]
+
+        assert shard["bytes"] == os.path.getsize(tmp_path / shard["file"])
+
+
+def test_writes_other_headwords_to_own_shard(tmp_path: Path) -> None:
+    shard_entries = entries + [
+        Entry(headword="abe", definitions="no. abe.", status=EntryStatus.VALID),
+        Entry(headword="", definitions="fremede", status=EntryStatus.VALID),
+        Entry(headword="(Hellig)", definitions="no.", status=EntryStatus.VALID),
+    ]
+
+    write_entries(shard_entries, [ShardedJsonEntryWriter(str(tmp_path))])
+
+    with open(tmp_path / "manifest.json", "r") as manifest_file:
+        shards = json.load(manifest_file)["shards"]
+
+    assert [(shard["letter"], shard["file"], shard["entries"]) for shard in shards] == [
+        ("A", "a.json", 3),
+        ("other", "other.json", 2),
+    ]
+
+
+@pytest.mark.parametrize(
+    "compression, open_compressed", [("gzip", gzip.open), ("xz", lzma.open)]
+)
+def test_writes_compressed_json(
+    tmp_path: Path, compression: str, open_compressed: Callable[..., IO[bytes]]
+) -> None:
+    dictionary = Dictionary(
+        [
+            DictionaryPage(
+                name="3556-ydekorn.txt",
+                lines=open_test_file("split-y-continuation.txt"),
+            )
+        ]
+    )
+    expected_file = io.StringIO()
+    write_entries_to_json(dictionary.get_entries(), expected_file)
+
+    write_dictionary_to_files(
+        dictionary,
+        json_file_path=str(tmp_path / "dictionary.json.compressed"),
+        shards_folder_path=str(tmp_path / "shards"),
+        compression=compression,
+        compression_level=1,
+    )
+
+    with open_compressed(tmp_path / "dictionary.json.compressed") as json_file:
+        assert json_file.read().decode() == expected_file.getvalue()
+
+    with open(tmp_path / "shards" / "manifest.json", "r") as manifest_file:
+        manifest = json.load(manifest_file)
+
+    assert manifest["compression"] == compression
+
+    shard_entries = []
+
+    for shard in manifest["shards"]:
+        with open_compressed(tmp_path / "shards" / shard["file"]) as shard_file:
+            shard_entries.extend(json.loads(shard_file.read()))
+
+    assert shard_entries == json.loads(expected_file.getvalue())